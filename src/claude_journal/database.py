@@ -1,15 +1,191 @@
 """SQLite database operations for journal entries."""
 
+import asyncio
+import re
 import sqlite3
+import tempfile
+import threading
+from contextlib import contextmanager
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, Iterator, List, Dict, Any, Sequence, Tuple
 from datetime import datetime
 import os
 
 
+# Resolved once per process; the MCP server opens the default journal
+_DEFAULT_DB_PATH = Path(os.path.expanduser("~/.claude/journal.db"))
+
+# Parent directories already created by this process
+_READY_DIRS = set()
+
+# INSERT ... RETURNING needs SQLite 3.35+
+_SUPPORTS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+
+def _locked(method):
+    """Run a JournalDatabase method while holding the instance lock."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def _apply_pragmas(conn: sqlite3.Connection):
+    """Tune a connection for a local, single-user journal.
+
+    WAL with NORMAL sync turns each commit into a single append, temp
+    tables live in memory, and reads are served from a 64 MB page cache
+    and a 256 MB memory map.
+
+    Args:
+        conn: Connection to configure
+    """
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-64000")
+    conn.execute("PRAGMA mmap_size=268435456")
+    # Lets deletes cascade from journal_entries to journal_tags
+    conn.execute("PRAGMA foreign_keys=ON")
+
+
+# Search query syntax, compiled once at import
+_ID_RE = re.compile(r'^(?:id:)?(\d+)$', re.IGNORECASE)
+_TAG_RE = re.compile(r'(?:tag:(\w+)|#(\w+))')
+_PHRASE_RE = re.compile(r'"([^"]+)"')
+_TIME_KEYWORDS = [
+    'yesterday', 'today', 'last week', 'last month', 'last year',
+    'this week', 'this month', 'this year', 'last \\d+ days?',
+    'last \\d+ weeks?', 'last \\d+ months?', 'january', 'february',
+    'march', 'april', 'may', 'june', 'july', 'august', 'september',
+    'october', 'november', 'december'
+]
+_TIME_RE = re.compile(
+    rf'\b({"|".join(_TIME_KEYWORDS)})\b(?:\s+(\d{{4}}))?', re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=256)
+def _parse_query(
+    query: str
+) -> Tuple[Tuple[str, ...], Tuple[str, ...], Optional[str], Tuple[str, ...]]:
+    """Split a search query into its components.
+
+    The result depends only on the query text (time expressions are
+    returned unresolved), so it is cached across calls.
+
+    Args:
+        query: Search query with optional special syntax
+
+    Returns:
+        Tuple of (tags, exact phrases, time expression or None, keywords)
+    """
+    tags = []
+    phrases = []
+    time_expression = None
+
+    # Extract tags (tag:name or #name)
+    query = _TAG_RE.sub(
+        lambda m: (tags.append(m.group(1) or m.group(2)), '')[1],
+        query
+    )
+
+    # Extract exact phrases ("quoted text")
+    query = _PHRASE_RE.sub(
+        lambda m: (phrases.append(m.group(1)), '')[1],
+        query
+    )
+
+    # Check for time expressions (last week, yesterday, etc.)
+    time_match = _TIME_RE.search(query)
+    if time_match:
+        time_expression = time_match.group(0).strip()
+        query = query.replace(time_match.group(0), '')
+
+    # Remaining text is keywords
+    keywords = tuple(k.strip() for k in query.split() if k.strip())
+
+    return tuple(tags), tuple(phrases), time_expression, keywords
+
+
 class JournalDatabase:
     """Manages journal entries in SQLite database."""
 
+    # SQL for the hot paths is kept as constants so every call passes the
+    # same text and hits the connection's prepared-statement cache
+    _SQL_INSERT = (
+        "INSERT INTO journal_entries (project, title, description, tags) "
+        "VALUES (?, ?, ?, ?)"
+    )
+    _SQL_INSERT_RETURNING = _SQL_INSERT + " RETURNING id"
+    _SQL_INSERT_TAG = (
+        "INSERT OR IGNORE INTO journal_tags (entry_id, tag) VALUES (?, ?)"
+    )
+    _SQL_GET_BY_ID = "SELECT * FROM journal_entries WHERE id = ?"
+    _SQL_RECENT = (
+        "SELECT * FROM journal_entries ORDER BY created_at DESC LIMIT ?"
+    )
+    _SQL_RECENT_BY_PROJECT = (
+        "SELECT * FROM journal_entries WHERE project = ? "
+        "ORDER BY created_at DESC LIMIT ?"
+    )
+    _SQL_DELETE = "DELETE FROM journal_entries WHERE id = ?"
+    _SQL_DELETE_BY_PROJECT = "DELETE FROM journal_entries WHERE project = ?"
+    # Keeps the FTS index current as entries are added; import_from_db
+    # lifts it while bulk loading
+    _SQL_FTS_INSERT_TRIGGER = """
+        CREATE TRIGGER IF NOT EXISTS journal_entries_ai
+        AFTER INSERT ON journal_entries BEGIN
+            INSERT INTO journal_entries_fts(rowid, title, description, tags)
+            VALUES (new.id, new.title, new.description, new.tags);
+        END
+    """
+    # Copies rows from the attached "source" database, skipping exact
+    # matches; idx_dedup turns the duplicate check into one index seek
+    # per source row
+    _SQL_IMPORT = """
+        INSERT INTO journal_entries (created_at, project, title, description, tags)
+        SELECT s.created_at, s.project, s.title, s.description, s.tags
+        FROM source.journal_entries s
+        LEFT JOIN main.journal_entries d
+            ON d.created_at = s.created_at
+            AND d.title = s.title
+            AND d.description = s.description
+        WHERE d.id IS NULL
+    """
+
+    # Core table and indexes, applied as one script on every open
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS journal_entries (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            created_at TEXT NOT NULL DEFAULT (datetime('now')),
+            project TEXT,
+            title TEXT NOT NULL,
+            description TEXT NOT NULL,
+            tags TEXT
+        );
+
+        -- Create indexes for better query performance
+        CREATE INDEX IF NOT EXISTS idx_created_at
+        ON journal_entries(created_at);
+
+        -- Serves project filters ordered by recency without a separate sort;
+        -- it supersedes the single-column idx_project of older databases
+        CREATE INDEX IF NOT EXISTS idx_project_created
+        ON journal_entries(project, created_at DESC);
+
+        DROP INDEX IF EXISTS idx_project;
+
+        -- Covers the duplicate check in import_from_db
+        CREATE INDEX IF NOT EXISTS idx_dedup
+        ON journal_entries(created_at, title, description);
+    """
+
+    # Size of sqlite3's per-connection statement cache
+    _CACHED_STATEMENTS = 256
+
     def __init__(self, db_path: Optional[str] = None):
         """Initialize database connection.
 
@@ -17,48 +193,271 @@ class JournalDatabase:
             db_path: Path to SQLite database file.
                     Defaults to ~/.claude/journal.db
         """
-        if db_path is None:
-            db_path = os.path.expanduser("~/.claude/journal.db")
-
-        self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-
-        self.conn = sqlite3.connect(str(self.db_path))
+        self.db_path = _DEFAULT_DB_PATH if db_path is None else Path(db_path)
+
+        parent = self.db_path.parent
+        if parent not in _READY_DIRS:
+            parent.mkdir(parents=True, exist_ok=True)
+            _READY_DIRS.add(parent)
+
+        # The server calls these methods from worker threads through
+        # asyncio.to_thread; _lock serializes every use of the connection
+        self.conn = sqlite3.connect(
+            str(self.db_path),
+            cached_statements=self._CACHED_STATEMENTS,
+            check_same_thread=False
+        )
+        self._lock = threading.RLock()
+        # Query methods return these rows directly; sqlite3.Row reads
+        # columns by name without copying each row into a dict
         self.conn.row_factory = sqlite3.Row
+        _apply_pragmas(self.conn)
+        self._in_batch = False
         self._init_database()
 
     def _init_database(self):
         """Create tables and indexes if they don't exist."""
+        self.conn.executescript(self._SCHEMA)
+
+        self._init_tags()
+
+        self._fts_enabled = self._init_fts()
+
+        self._analyze()
+
+        self.conn.commit()
+
+    def _analyze(self):
+        """Keep the query planner's statistics for journal_entries current.
+
+        The statistics let the planner choose between idx_project_created
+        and idx_created_at. They are first collected by the first open that
+        finds entries, since an empty table has nothing to measure. After
+        that PRAGMA optimize refreshes them on open once the table has
+        grown (SQLite 3.46+; older versions keep the first statistics).
+        """
+        has_stats = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name='sqlite_stat1'"
+        ).fetchone() is not None and self.conn.execute(
+            "SELECT 1 FROM sqlite_stat1 WHERE tbl='journal_entries'"
+        ).fetchone() is not None
+
+        if not has_stats and self.conn.execute(
+            "SELECT 1 FROM journal_entries LIMIT 1"
+        ).fetchone() is not None:
+            self.conn.execute("ANALYZE journal_entries")
+
+        # 0x10000 checks every table rather than only those this
+        # connection has queried, which on open is none
+        self.conn.execute("PRAGMA optimize=0x10002")
+
+    def _init_tags(self):
+        """Create the tag lookup table used by tag filters.
+
+        Each tag of an entry is stored as its own row so a tag filter is
+        an index seek rather than a scan of every entry's tag list. The
+        comma-separated tags column stays the source of truth for display
+        and export. If the table is created against an existing database,
+        it is filled from the current rows.
+        """
+        existed = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='journal_tags'"
+        ).fetchone() is not None
+
         self.conn.execute("""
-            CREATE TABLE IF NOT EXISTS journal_entries (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                created_at TEXT NOT NULL DEFAULT (datetime('now')),
-                project TEXT,
-                title TEXT NOT NULL,
-                description TEXT NOT NULL,
-                tags TEXT
-            )
+            CREATE TABLE IF NOT EXISTS journal_tags (
+                entry_id INTEGER NOT NULL
+                    REFERENCES journal_entries(id) ON DELETE CASCADE,
+                tag TEXT NOT NULL COLLATE NOCASE,
+                PRIMARY KEY (tag, entry_id)
+            ) WITHOUT ROWID
         """)
 
-        # Create indexes for better query performance
+        # Lets ON DELETE CASCADE find an entry's tags without a scan
         self.conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_created_at
-            ON journal_entries(created_at)
+            CREATE INDEX IF NOT EXISTS idx_tags_entry
+            ON journal_tags(entry_id)
         """)
 
+        if not existed:
+            self._index_tags()
+
+    def _index_tags(self, after_id: int = 0):
+        """Split the tags column into journal_tags rows.
+
+        Args:
+            after_id: Only index entries with an ID greater than this
+        """
         self.conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_project
-            ON journal_entries(project)
+            INSERT OR IGNORE INTO journal_tags (entry_id, tag)
+            WITH RECURSIVE split(entry_id, tag, rest) AS (
+                SELECT id, '', tags || ','
+                FROM journal_entries
+                WHERE id > ? AND tags IS NOT NULL
+                UNION ALL
+                SELECT
+                    entry_id,
+                    substr(rest, 1, instr(rest, ',') - 1),
+                    substr(rest, instr(rest, ',') + 1)
+                FROM split
+                WHERE rest <> ''
+            )
+            SELECT entry_id, tag FROM split WHERE tag <> ''
+        """, (after_id,))
+
+    def _init_fts(self) -> bool:
+        """Create the FTS5 index over title, description and tags.
+
+        The index is an external-content table kept in sync with
+        journal_entries by triggers. It uses the trigram tokenizer so a
+        keyword matches anywhere inside a word, as the LIKE search did.
+        If it is created against an existing database, it is rebuilt
+        from the current rows.
+
+        Returns:
+            True if the index is available, False if SQLite lacks FTS5 or
+            the trigram tokenizer (added in SQLite 3.34)
+        """
+        existed = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='journal_entries_fts'"
+        ).fetchone() is not None
+
+        try:
+            self.conn.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS journal_entries_fts USING fts5(
+                    title, description, tags,
+                    content='journal_entries',
+                    content_rowid='id',
+                    tokenize='trigram'
+                )
+            """)
+        except sqlite3.OperationalError:
+            # No usable FTS5; search falls back to LIKE. Sync triggers left
+            # by an older index would now point at a missing table
+            self.conn.executescript("""
+                DROP TRIGGER IF EXISTS journal_entries_ai;
+                DROP TRIGGER IF EXISTS journal_entries_ad;
+                DROP TRIGGER IF EXISTS journal_entries_au;
+            """)
+            return False
+
+        self.conn.execute(self._SQL_FTS_INSERT_TRIGGER)
+        self.conn.executescript("""
+            CREATE TRIGGER IF NOT EXISTS journal_entries_ad
+            AFTER DELETE ON journal_entries BEGIN
+                INSERT INTO journal_entries_fts(journal_entries_fts, rowid, title, description, tags)
+                VALUES ('delete', old.id, old.title, old.description, old.tags);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS journal_entries_au
+            AFTER UPDATE ON journal_entries BEGIN
+                INSERT INTO journal_entries_fts(journal_entries_fts, rowid, title, description, tags)
+                VALUES ('delete', old.id, old.title, old.description, old.tags);
+                INSERT INTO journal_entries_fts(rowid, title, description, tags)
+                VALUES (new.id, new.title, new.description, new.tags);
+            END;
         """)
 
-        self.conn.commit()
+        if not existed:
+            # Index any entries written before the FTS table existed
+            self.conn.execute(
+                "INSERT INTO journal_entries_fts(journal_entries_fts) VALUES ('rebuild')"
+            )
+
+        return True
+
+    def _keyword_clause(self, keywords: List[str]) -> Tuple[str, List[Any]]:
+        """Build a WHERE clause requiring every keyword to match an entry.
 
+        Uses the FTS5 trigram index when available, otherwise a LIKE scan.
+        Either way a keyword matches any substring of the title,
+        description or tags. Trigrams can't match fewer than three
+        characters, so shorter keywords always use LIKE.
+
+        Args:
+            keywords: Search terms that must all match
+
+        Returns:
+            Tuple of (SQL fragment starting with AND, parameters)
+        """
+        conditions = []
+        params = []
+
+        if self._fts_enabled:
+            indexed = [keyword for keyword in keywords if len(keyword) >= 3]
+            if indexed:
+                conditions.append(
+                    "id IN (SELECT rowid FROM journal_entries_fts"
+                    " WHERE journal_entries_fts MATCH ?)"
+                )
+                params.append(" AND ".join(
+                    '"' + keyword.replace('"', '""') + '"' for keyword in indexed
+                ))
+            keywords = [keyword for keyword in keywords if len(keyword) < 3]
+
+        # One LIKE per keyword against all searchable text; the separator
+        # keeps a keyword from matching across two columns
+        for keyword in keywords:
+            conditions.append(
+                "(title || char(31) || description || char(31) || "
+                "coalesce(tags, '')) LIKE ?"
+            )
+            params.append(f"%{keyword}%")
+
+        return " AND " + " AND ".join(conditions), params
+
+    def _commit(self):
+        """Commit the current write unless a batch() transaction is open."""
+        if not self._in_batch:
+            self.conn.commit()
+
+    @contextmanager
+    def batch(self):
+        """Group several writes into a single transaction.
+
+        add_entry, delete_entry and delete_by_project skip their own commit
+        inside the block; everything is committed once on exit, or rolled
+        back if the block raises.
+
+        The instance lock is held for the whole block, so a batch can't be
+        opened on an event loop thread: a worker thread awaited inside the
+        block would wait on that lock forever. Run the whole batch in one
+        worker thread instead.
+
+        Example:
+            with db.batch():
+                for title, description in rows:
+                    db.add_entry(title, description)
+
+        Raises:
+            RuntimeError: If called from a running event loop
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise RuntimeError("batch() can't be used on an event loop thread")
+
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            self._in_batch = True
+            try:
+                yield self
+                self.conn.commit()
+            except BaseException:
+                self.conn.rollback()
+                raise
+            finally:
+                self._in_batch = False
+
+    @_locked
     def add_entry(
         self,
         title: str,
         description: str,
         project: Optional[str] = None,
-        tags: Optional[List[str]] = None
+        tags: Optional[Sequence[str]] = None
     ) -> int:
         """Add a new journal entry.
 
@@ -73,20 +472,30 @@ class JournalDatabase:
         """
         tags_str = ",".join(tags) if tags else None
 
-        cursor = self.conn.execute("""
-            INSERT INTO journal_entries (project, title, description, tags)
-            VALUES (?, ?, ?, ?)
-        """, (project, title, description, tags_str))
+        params = (project, title, description, tags_str)
+        if _SUPPORTS_RETURNING:
+            entry_id = self.conn.execute(
+                self._SQL_INSERT_RETURNING, params
+            ).fetchone()[0]
+        else:
+            entry_id = self.conn.execute(self._SQL_INSERT, params).lastrowid
+
+        if tags_str:
+            self.conn.executemany(
+                self._SQL_INSERT_TAG,
+                [(entry_id, tag) for tag in tags_str.split(",") if tag]
+            )
 
-        self.conn.commit()
-        return cursor.lastrowid
+        self._commit()
+        return entry_id
 
+    @_locked
     def search(
         self,
         query: str,
         project: Optional[str] = None,
         limit: int = 20
-    ) -> List[Dict[str, Any]]:
+    ) -> List[sqlite3.Row]:
         """Search journal entries with advanced query syntax.
 
         Supports:
@@ -104,60 +513,28 @@ class JournalDatabase:
         Returns:
             List of matching entries
         """
-        import re
-
         # Check for ID-only search (numeric or id:N)
-        id_match = re.match(r'^(?:id:)?(\d+)$', query.strip(), re.IGNORECASE)
+        id_match = _ID_RE.match(query.strip())
         if id_match:
             entry_id = int(id_match.group(1))
-            cursor = self.conn.execute(
-                "SELECT * FROM journal_entries WHERE id = ?",
-                (entry_id,)
-            )
+            cursor = self.conn.execute(self._SQL_GET_BY_ID, (entry_id,))
             result = cursor.fetchone()
-            return [dict(result)] if result else []
+            return [result] if result else []
 
         # Parse query components
-        tags_to_filter = []
-        exact_phrases = []
-        keywords = []
-        time_expression = None
-
-        # Extract tags (tag:name or #name)
-        query = re.sub(
-            r'(?:tag:(\w+)|#(\w+))',
-            lambda m: (tags_to_filter.append(m.group(1) or m.group(2)), '')[1],
-            query
-        )
-
-        # Extract exact phrases ("quoted text")
-        query = re.sub(
-            r'"([^"]+)"',
-            lambda m: (exact_phrases.append(m.group(1)), '')[1],
-            query
-        )
+        tags_to_filter, exact_phrases, time_expression, keywords = _parse_query(query)
+        keywords = list(keywords)
 
-        # Check for time expressions (last week, yesterday, etc.)
-        time_keywords = [
-            'yesterday', 'today', 'last week', 'last month', 'last year',
-            'this week', 'this month', 'this year', 'last \\d+ days?',
-            'last \\d+ weeks?', 'last \\d+ months?', 'january', 'february',
-            'march', 'april', 'may', 'june', 'july', 'august', 'september',
-            'october', 'november', 'december'
-        ]
-        time_pattern = '|'.join(time_keywords)
-        time_match = re.search(rf'\b({time_pattern})\b(?:\s+(\d{{4}}))?', query, re.IGNORECASE)
-        if time_match:
-            time_expression = time_match.group(0).strip()
-            query = query.replace(time_match.group(0), '')
-
-        # Remaining text is keywords
-        keywords = [k.strip() for k in query.split() if k.strip()]
-
-        # Build SQL query
+        # Build SQL query; cheap indexed filters go first so they prune
+        # rows before the string matching below
         sql = "SELECT * FROM journal_entries WHERE 1=1"
         params = []
 
+        # Apply project filter
+        if project:
+            sql += " AND project = ?"
+            params.append(project)
+
         # Apply time range filter if time expression found
         if time_expression:
             try:
@@ -171,57 +548,36 @@ class JournalDatabase:
 
         # Apply tag filters
         for tag in tags_to_filter:
-            sql += " AND (LOWER(tags) LIKE ? OR LOWER(tags) LIKE ? OR LOWER(tags) LIKE ? OR LOWER(tags) = ?)"
-            tag_lower = tag.lower()
-            params.extend([
-                f"%,{tag_lower},%",  # middle of list
-                f"{tag_lower},%",     # start of list
-                f"%,{tag_lower}",     # end of list
-                tag_lower             # only item
-            ])
-
-        # Apply exact phrase matches
+            sql += " AND id IN (SELECT entry_id FROM journal_tags WHERE tag = ?)"
+            params.append(tag)
+
+        # Apply exact phrase matches (LIKE is already case-insensitive)
         for phrase in exact_phrases:
-            phrase_lower = f"%{phrase.lower()}%"
-            sql += """ AND (
-                LOWER(title) LIKE ? OR
-                LOWER(description) LIKE ?
-            )"""
-            params.extend([phrase_lower, phrase_lower])
+            phrase_pattern = f"%{phrase}%"
+            sql += " AND (title LIKE ? OR description LIKE ?)"
+            params.extend([phrase_pattern, phrase_pattern])
 
         # Apply keyword searches
         if keywords:
-            keyword_conditions = []
-            for keyword in keywords:
-                keyword_lower = f"%{keyword.lower()}%"
-                keyword_conditions.append("""(
-                    LOWER(title) LIKE ? OR
-                    LOWER(description) LIKE ? OR
-                    LOWER(tags) LIKE ?
-                )""")
-                params.extend([keyword_lower, keyword_lower, keyword_lower])
-
-            sql += " AND (" + " AND ".join(keyword_conditions) + ")"
-
-        # Apply project filter
-        if project:
-            sql += " AND project = ?"
-            params.append(project)
+            clause, clause_params = self._keyword_clause(keywords)
+            sql += clause
+            params.extend(clause_params)
 
         # Order and limit
         sql += " ORDER BY created_at DESC LIMIT ?"
         params.append(limit)
 
         cursor = self.conn.execute(sql, params)
-        return [dict(row) for row in cursor.fetchall()]
+        return cursor.fetchall()
 
+    @_locked
     def get_by_time_range(
         self,
         start_date: str,
         end_date: str,
         query: Optional[str] = None,
         project: Optional[str] = None
-    ) -> List[Dict[str, Any]]:
+    ) -> List[sqlite3.Row]:
         """Get entries within a time range.
 
         Args:
@@ -239,29 +595,60 @@ class JournalDatabase:
         """
         params = [start_date, end_date]
 
-        if query:
-            query_lower = f"%{query.lower()}%"
-            sql += """ AND (
-                LOWER(title) LIKE ? OR
-                LOWER(description) LIKE ? OR
-                LOWER(tags) LIKE ?
-            )"""
-            params.extend([query_lower, query_lower, query_lower])
-
         if project:
             sql += " AND project = ?"
             params.append(project)
 
+        if query and query.strip():
+            # The whole query is one substring, not separate keywords
+            clause, clause_params = self._keyword_clause([query.strip()])
+            sql += clause
+            params.extend(clause_params)
+
         sql += " ORDER BY created_at DESC"
 
         cursor = self.conn.execute(sql, params)
-        return [dict(row) for row in cursor.fetchall()]
+        return cursor.fetchall()
+
+    def iter_recent(
+        self,
+        limit: int = 10,
+        project: Optional[str] = None
+    ) -> Iterator[sqlite3.Row]:
+        """Stream the most recent journal entries.
+
+        Rows are read from the cursor as the caller iterates, so a caller
+        that stops early never builds the rest. The instance lock is held
+        and the query stays open until the iterator is exhausted or
+        closed, so a caller that stops early should close it, e.g. with
+        contextlib.closing.
+
+        Args:
+            limit: Maximum number of entries to yield
+            project: Optional project filter
+
+        Yields:
+            Recent entries, newest first
+        """
+        with self._lock:
+            if project:
+                cursor = self.conn.execute(
+                    self._SQL_RECENT_BY_PROJECT, (project, limit)
+                )
+            else:
+                cursor = self.conn.execute(self._SQL_RECENT, (limit,))
 
+            try:
+                yield from cursor
+            finally:
+                cursor.close()
+
+    @_locked
     def list_recent(
         self,
         limit: int = 10,
         project: Optional[str] = None
-    ) -> List[Dict[str, Any]]:
+    ) -> List[sqlite3.Row]:
         """Get most recent journal entries.
 
         Args:
@@ -271,24 +658,14 @@ class JournalDatabase:
         Returns:
             List of recent entries
         """
-        sql = "SELECT * FROM journal_entries"
-        params = []
-
-        if project:
-            sql += " WHERE project = ?"
-            params.append(project)
-
-        sql += " ORDER BY created_at DESC LIMIT ?"
-        params.append(limit)
+        return list(self.iter_recent(limit, project))
 
-        cursor = self.conn.execute(sql, params)
-        return [dict(row) for row in cursor.fetchall()]
-
-    def list_projects(self) -> List[Dict[str, Any]]:
+    @_locked
+    def list_projects(self) -> List[sqlite3.Row]:
         """Get all projects with entry counts.
 
         Returns:
-            List of {project, count} dicts
+            List of (project, count) rows
         """
         cursor = self.conn.execute("""
             SELECT
@@ -299,36 +676,42 @@ class JournalDatabase:
             GROUP BY project
             ORDER BY count DESC
         """)
-        return [dict(row) for row in cursor.fetchall()]
+        return cursor.fetchall()
 
+    @_locked
     def get_stats(self) -> Dict[str, Any]:
         """Get database statistics.
 
         Returns:
             Dict with total entries, date range, projects
         """
+        # One grouped pass; the totals are folded from the per-project rows
         cursor = self.conn.execute("""
             SELECT
-                COUNT(*) as total_entries,
+                project,
+                COUNT(*) as count,
                 MIN(created_at) as first_entry,
-                MAX(created_at) as last_entry,
-                COUNT(DISTINCT project) as total_projects
-            FROM journal_entries
-        """)
-
-        stats = dict(cursor.fetchone())
-
-        # Get entries per project
-        cursor = self.conn.execute("""
-            SELECT project, COUNT(*) as count
+                MAX(created_at) as last_entry
             FROM journal_entries
-            WHERE project IS NOT NULL
             GROUP BY project
         """)
-        stats['entries_per_project'] = [dict(row) for row in cursor.fetchall()]
+        groups = cursor.fetchall()
+
+        entries_per_project = [
+            {'project': g['project'], 'count': g['count']}
+            for g in groups
+            if g['project'] is not None
+        ]
 
-        return stats
+        return {
+            'total_entries': sum(g['count'] for g in groups),
+            'first_entry': min((g['first_entry'] for g in groups), default=None),
+            'last_entry': max((g['last_entry'] for g in groups), default=None),
+            'total_projects': len(entries_per_project),
+            'entries_per_project': entries_per_project,
+        }
 
+    @_locked
     def delete_entry(self, entry_id: int) -> bool:
         """Delete a specific journal entry.
 
@@ -338,12 +721,11 @@ class JournalDatabase:
         Returns:
             True if entry was deleted, False if not found
         """
-        cursor = self.conn.execute("""
-            DELETE FROM journal_entries WHERE id = ?
-        """, (entry_id,))
-        self.conn.commit()
+        cursor = self.conn.execute(self._SQL_DELETE, (entry_id,))
+        self._commit()
         return cursor.rowcount > 0
 
+    @_locked
     def delete_by_project(self, project: str) -> int:
         """Delete all entries for a project.
 
@@ -353,12 +735,11 @@ class JournalDatabase:
         Returns:
             Number of entries deleted
         """
-        cursor = self.conn.execute("""
-            DELETE FROM journal_entries WHERE project = ?
-        """, (project,))
-        self.conn.commit()
+        cursor = self.conn.execute(self._SQL_DELETE_BY_PROJECT, (project,))
+        self._commit()
         return cursor.rowcount
 
+    @_locked
     def import_from_db(self, source_db_path: str) -> int:
         """Import entries from another journal database.
 
@@ -372,30 +753,49 @@ class JournalDatabase:
         if not source_path.exists():
             raise FileNotFoundError(f"Source database not found: {source_path}")
 
-        # Attach source database
-        self.conn.execute(f"ATTACH DATABASE ? AS source", (str(source_path),))
-
-        # Import entries (avoiding duplicates by checking if exact match exists)
-        cursor = self.conn.execute("""
-            INSERT INTO journal_entries (created_at, project, title, description, tags)
-            SELECT created_at, project, title, description, tags
-            FROM source.journal_entries
-            WHERE NOT EXISTS (
-                SELECT 1 FROM journal_entries
-                WHERE journal_entries.created_at = source.journal_entries.created_at
-                AND journal_entries.title = source.journal_entries.title
-                AND journal_entries.description = source.journal_entries.description
-            )
-        """)
-
-        imported = cursor.rowcount
-        self.conn.commit()
-
-        # Detach source database
-        self.conn.execute("DETACH DATABASE source")
+        # Attach source database (ATTACH/DETACH can't run inside a transaction)
+        self.conn.execute("ATTACH DATABASE ? AS source", (str(source_path),))
+
+        try:
+            # Import entries in one set-based statement
+            with self.conn:
+                # sqlite3 only opens transactions implicitly before DML, so
+                # begin explicitly to cover the trigger DDL below. Taking the
+                # write lock up front keeps another process from committing
+                # between the MAX(id) read and the first write, which would
+                # fail at once instead of waiting out the busy timeout
+                if not self.conn.in_transaction:
+                    self.conn.execute("BEGIN IMMEDIATE")
+
+                last_id = self.conn.execute(
+                    "SELECT COALESCE(MAX(id), 0) FROM main.journal_entries"
+                ).fetchone()[0]
+
+                if self._fts_enabled:
+                    # Index the new rows in one pass instead of firing the
+                    # insert trigger per row; a failed import rolls the
+                    # trigger back with everything else
+                    self.conn.execute("DROP TRIGGER journal_entries_ai")
+
+                imported = self.conn.execute(self._SQL_IMPORT).rowcount
+
+                if self._fts_enabled:
+                    self.conn.execute("""
+                        INSERT INTO journal_entries_fts(rowid, title, description, tags)
+                        SELECT id, title, description, tags
+                        FROM main.journal_entries
+                        WHERE id > ?
+                    """, (last_id,))
+                    self.conn.execute(self._SQL_FTS_INSERT_TRIGGER)
+
+                self._index_tags(after_id=last_id)
+        finally:
+            # Detach source database
+            self.conn.execute("DETACH DATABASE source")
 
         return imported
 
+    @_locked
     def export_to_db(self, dest_db_path: Optional[str] = None) -> str:
         """Export journal to a new database file.
 
@@ -411,14 +811,37 @@ class JournalDatabase:
             dest_db_path = f"journal_export_{timestamp}.db"
 
         dest_path = Path(dest_db_path).expanduser()
-
-        # Create backup using SQLite backup API
-        backup_conn = sqlite3.connect(str(dest_path))
-        self.conn.backup(backup_conn)
-        backup_conn.close()
+        if dest_path.resolve() == self.db_path.resolve():
+            raise ValueError(f"Cannot export the journal onto itself: {dest_path}")
+
+        # Write the copy next to the destination and move it into place
+        # only once it is complete, so a failed export leaves any previous
+        # file untouched
+        fd, tmp_name = tempfile.mkstemp(
+            prefix=f".{dest_path.name}.", suffix=".tmp", dir=dest_path.parent
+        )
+        os.close(fd)
+
+        try:
+            if sqlite3.sqlite_version_info >= (3, 27, 0):
+                # VACUUM INTO writes a compacted copy entirely inside SQLite;
+                # it accepts the empty file mkstemp created
+                self.conn.execute("VACUUM INTO ?", (tmp_name,))
+            else:
+                # Create backup using SQLite backup API
+                backup_conn = sqlite3.connect(tmp_name)
+                _apply_pragmas(backup_conn)
+                self.conn.backup(backup_conn, pages=64)
+                backup_conn.close()
+
+            os.replace(tmp_name, dest_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
 
         return str(dest_path)
 
+    @_locked
     def close(self):
         """Close database connection."""
         self.conn.close()
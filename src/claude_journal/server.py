@@ -1,15 +1,18 @@
 """MCP server for Claude Journal."""
 
 import asyncio
-from typing import Optional, List
+import logging
+import sqlite3
+from typing import Awaitable, Callable, Dict, Optional, List
 from mcp.server import Server
 from mcp.types import Tool, TextContent
-import json
 
 from .database import JournalDatabase
 from .time_parser import parse_time_expression
 
 
+logger = logging.getLogger(__name__)
+
 # Initialize database
 db = JournalDatabase()
 
@@ -17,394 +20,441 @@ db = JournalDatabase()
 app = Server("claude-journal")
 
 
-@app.list_tools()
-async def list_tools() -> List[Tool]:
-    """List available journal tools."""
-    return [
-        Tool(
-            name="journal_add",
-            description="Add a new journal entry manually. Use when the user explicitly asks to save/remember something.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {
-                        "type": "string",
-                        "description": "Brief title for the entry"
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "Detailed description (1-2 sentences)"
-                    },
-                    "project": {
-                        "type": "string",
-                        "description": "Optional project/repo name"
-                    },
-                    "tags": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Optional list of tags"
-                    }
+# Tool definitions are static, so they are built once at import
+_TOOLS: List[Tool] = [
+    Tool(
+        name="journal_add",
+        description="Add a new journal entry manually. Use when the user explicitly asks to save/remember something.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {
+                    "type": "string",
+                    "description": "Brief title for the entry"
                 },
-                "required": ["title", "description"]
-            }
-        ),
-        Tool(
-            name="journal_auto_capture",
-            description="Automatically capture significant work. Use when substantial progress or decisions were made (context-based). Called by hooks every 30 minutes if activity occurred. Summarize the goal (what we were trying to do) and what was accomplished.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {
-                        "type": "string",
-                        "description": "Brief title summarizing what was accomplished"
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "Detailed description: the goal (what we were trying to do) and what was done (1-2 sentences)"
-                    },
-                    "project": {
-                        "type": "string",
-                        "description": "Optional project/repo name"
-                    },
-                    "tags": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Optional list of tags"
-                    }
+                "description": {
+                    "type": "string",
+                    "description": "Detailed description (1-2 sentences)"
                 },
-                "required": ["title", "description"]
-            }
-        ),
-        Tool(
-            name="journal_search",
-            description="Search journal entries with advanced query syntax. Supports: ID search (\"42\" or \"id:42\"), tag filtering (\"tag:bugfix\" or \"#bugfix\"), exact phrases (\"\\\"user auth\\\"\"), date ranges (\"last week authentication\"), and keywords. All filters can be combined.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search query with optional syntax: ID (42 or id:42), tags (tag:name or #name), exact phrases (\"phrase\"), time (last week, yesterday), keywords"
-                    },
-                    "project": {
-                        "type": "string",
-                        "description": "Optional project filter"
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum results (default: 20)",
-                        "default": 20
-                    }
+                "project": {
+                    "type": "string",
+                    "description": "Optional project/repo name"
                 },
-                "required": ["query"]
-            }
-        ),
-        Tool(
-            name="journal_time_query",
-            description="Find entries by time period. Supports natural language like 'last month', 'yesterday', 'january 2024', 'last 3 days'. Use when user asks 'what did I work on X time ago' or 'when did I do X'.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "time_expression": {
-                        "type": "string",
-                        "description": "Time period (e.g., 'last week', 'yesterday', 'january')"
-                    },
-                    "query": {
-                        "type": "string",
-                        "description": "Optional text filter within time range"
-                    },
-                    "project": {
-                        "type": "string",
-                        "description": "Optional project filter"
-                    }
+                "tags": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Optional list of tags"
+                }
+            },
+            "required": ["title", "description"]
+        }
+    ),
+    Tool(
+        name="journal_auto_capture",
+        description="Automatically capture significant work. Use when substantial progress or decisions were made (context-based). Called by hooks every 30 minutes if activity occurred. Summarize the goal (what we were trying to do) and what was accomplished.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {
+                    "type": "string",
+                    "description": "Brief title summarizing what was accomplished"
                 },
-                "required": ["time_expression"]
-            }
-        ),
-        Tool(
-            name="journal_list_recent",
-            description="Get most recent journal entries. Useful for remembering recent work after context cleared.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "limit": {
-                        "type": "integer",
-                        "description": "Number of entries (default: 10)",
-                        "default": 10
-                    },
-                    "project": {
-                        "type": "string",
-                        "description": "Optional project filter"
-                    }
+                "description": {
+                    "type": "string",
+                    "description": "Detailed description: the goal (what we were trying to do) and what was done (1-2 sentences)"
+                },
+                "project": {
+                    "type": "string",
+                    "description": "Optional project/repo name"
+                },
+                "tags": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Optional list of tags"
                 }
-            }
-        ),
-        Tool(
-            name="journal_list_projects",
-            description="List all projects with entry counts. Useful for seeing what projects we've worked on.",
-            inputSchema={
-                "type": "object",
-                "properties": {}
-            }
-        ),
-        Tool(
-            name="journal_stats",
-            description="Get journal statistics including total entries, date ranges, and per-project counts.",
-            inputSchema={
-                "type": "object",
-                "properties": {}
-            }
-        ),
-        Tool(
-            name="journal_delete",
-            description="Delete a specific journal entry by ID. Use when user asks to forget something specific.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "entry_id": {
-                        "type": "integer",
-                        "description": "ID of the entry to delete"
-                    }
+            },
+            "required": ["title", "description"]
+        }
+    ),
+    Tool(
+        name="journal_search",
+        description="Search journal entries with advanced query syntax. Supports: ID search (\"42\" or \"id:42\"), tag filtering (\"tag:bugfix\" or \"#bugfix\"), exact phrases (\"\\\"user auth\\\"\"), date ranges (\"last week authentication\"), and keywords. All filters can be combined.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query with optional syntax: ID (42 or id:42), tags (tag:name or #name), exact phrases (\"phrase\"), time (last week, yesterday), keywords"
                 },
-                "required": ["entry_id"]
-            }
-        ),
-        Tool(
-            name="journal_delete_by_project",
-            description="Delete all entries for a specific project. Use with caution.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "project": {
-                        "type": "string",
-                        "description": "Project name"
-                    }
+                "project": {
+                    "type": "string",
+                    "description": "Optional project filter"
                 },
-                "required": ["project"]
-            }
-        ),
-        Tool(
-            name="journal_import",
-            description="Import entries from another journal database file. Merges with existing entries (avoids duplicates).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to source database file"
-                    }
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum results (default: 20)",
+                    "default": 20
+                }
+            },
+            "required": ["query"]
+        }
+    ),
+    Tool(
+        name="journal_time_query",
+        description="Find entries by time period. Supports natural language like 'last month', 'yesterday', 'january 2024', 'last 3 days'. Use when user asks 'what did I work on X time ago' or 'when did I do X'.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "time_expression": {
+                    "type": "string",
+                    "description": "Time period (e.g., 'last week', 'yesterday', 'january')"
+                },
+                "query": {
+                    "type": "string",
+                    "description": "Optional text filter within time range"
                 },
-                "required": ["file_path"]
+                "project": {
+                    "type": "string",
+                    "description": "Optional project filter"
+                }
+            },
+            "required": ["time_expression"]
+        }
+    ),
+    Tool(
+        name="journal_list_recent",
+        description="Get most recent journal entries. Useful for remembering recent work after context cleared.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "limit": {
+                    "type": "integer",
+                    "description": "Number of entries (default: 10)",
+                    "default": 10
+                },
+                "project": {
+                    "type": "string",
+                    "description": "Optional project filter"
+                }
             }
-        ),
-        Tool(
-            name="journal_export",
-            description="Export journal to a SQLite database file for sharing or backup.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Optional destination path (default: journal_export_TIMESTAMP.db)"
-                    }
+        }
+    ),
+    Tool(
+        name="journal_list_projects",
+        description="List all projects with entry counts. Useful for seeing what projects we've worked on.",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    ),
+    Tool(
+        name="journal_stats",
+        description="Get journal statistics including total entries, date ranges, and per-project counts.",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    ),
+    Tool(
+        name="journal_delete",
+        description="Delete a specific journal entry by ID. Use when user asks to forget something specific.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "entry_id": {
+                    "type": "integer",
+                    "description": "ID of the entry to delete"
+                }
+            },
+            "required": ["entry_id"]
+        }
+    ),
+    Tool(
+        name="journal_delete_by_project",
+        description="Delete all entries for a specific project. Use with caution.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "project": {
+                    "type": "string",
+                    "description": "Project name"
+                }
+            },
+            "required": ["project"]
+        }
+    ),
+    Tool(
+        name="journal_import",
+        description="Import entries from another journal database file. Merges with existing entries (avoids duplicates).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to source database file"
+                }
+            },
+            "required": ["file_path"]
+        }
+    ),
+    Tool(
+        name="journal_export",
+        description="Export journal to a SQLite database file for sharing or backup.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Optional destination path (default: journal_export_TIMESTAMP.db)"
                 }
             }
-        ),
-    ]
+        }
+    ),
+]
+
+
+def _text(msg: str) -> List[TextContent]:
+    """Wrap a message as a single-item tool result."""
+    return [TextContent(type="text", text=msg)]
+
+
+_ERR_PREFIX = "❌ Error: "
+
+# Constant replies are built once; the framework only reads them
+_NO_ENTRIES = _text("No journal entries found")
+_NO_PROJECTS = _text("No projects found in journal")
+_INTERNAL_ERROR = _text("❌ Internal error")
+
+
+@app.list_tools()
+async def list_tools() -> List[Tool]:
+    """List available journal tools."""
+    return _TOOLS
+
+
+async def _handle_add(arguments: dict) -> List[TextContent]:
+    """Handle journal_add: create an entry."""
+    entry_id = await asyncio.to_thread(
+        db.add_entry,
+        title=arguments["title"],
+        description=arguments["description"],
+        project=arguments.get("project"),
+        tags=arguments.get("tags")
+    )
+    return _text(f"✅ Journal entry created (ID: {entry_id})")
+
+
+async def _handle_auto_capture(arguments: dict) -> List[TextContent]:
+    """Handle journal_auto_capture: create an auto-capture entry."""
+    entry_id = await asyncio.to_thread(
+        db.add_entry,
+        title=arguments["title"],
+        description=arguments["description"],
+        project=arguments.get("project"),
+        tags=("auto-capture", *(arguments.get("tags") or ()))
+    )
+    return _text(f"📝 Auto-captured to journal (ID: {entry_id})")
+
+
+async def _handle_search(arguments: dict) -> List[TextContent]:
+    """Handle journal_search: run an advanced search."""
+    query = arguments["query"]
+    results = await asyncio.to_thread(
+        db.search,
+        query=query,
+        project=arguments.get("project"),
+        limit=arguments.get("limit", 20)
+    )
+
+    if not results:
+        return _text(f"No entries found matching '{query}'")
+
+    formatted = format_entries(results)
+    return _text(formatted)
+
+
+async def _handle_time_query(arguments: dict) -> List[TextContent]:
+    """Handle journal_time_query: list entries in a time period."""
+    time_expression = arguments["time_expression"]
+    start_date, end_date = parse_time_expression(time_expression)
+
+    results = await asyncio.to_thread(
+        db.get_by_time_range,
+        start_date=start_date,
+        end_date=end_date,
+        query=arguments.get("query"),
+        project=arguments.get("project")
+    )
+
+    if not results:
+        return _text(f"No entries found for '{time_expression}'")
+
+    formatted = format_entries(results, show_time=time_expression)
+    return _text(formatted)
+
+
+async def _handle_list_recent(arguments: dict) -> List[TextContent]:
+    """Handle journal_list_recent: list the newest entries."""
+    results = await asyncio.to_thread(
+        db.list_recent,
+        limit=arguments.get("limit", 10),
+        project=arguments.get("project")
+    )
+
+    if not results:
+        return _NO_ENTRIES
+
+    formatted = format_entries(results)
+    return _text(formatted)
+
+
+async def _handle_list_projects(arguments: dict) -> List[TextContent]:
+    """Handle journal_list_projects: list projects with counts."""
+    projects = await asyncio.to_thread(db.list_projects)
+
+    if not projects:
+        return _NO_PROJECTS
+
+    body = "\n".join(f"- {p['project']}: {p['count']} entries" for p in projects)
+    return _text(f"**Projects:**\n\n{body}\n")
+
+
+_STATS_TEMPLATE = """**Journal Statistics:**
+
+Total Entries: {total}
+First Entry: {first}
+Last Entry: {last}
+Total Projects: {projects}
+
+**Entries per Project:**
+{per_project}
+"""
+
+
+async def _handle_stats(arguments: dict) -> List[TextContent]:
+    """Handle journal_stats: summarize the journal."""
+    stats = await asyncio.to_thread(db.get_stats)
+    per_project = "\n".join(
+        f"- {p['project']}: {p['count']}"
+        for p in stats['entries_per_project']
+    ) or "No projects tracked"
+
+    return _text(_STATS_TEMPLATE.format(
+        total=stats['total_entries'],
+        first=stats['first_entry'] or 'N/A',
+        last=stats['last_entry'] or 'N/A',
+        projects=stats['total_projects'],
+        per_project=per_project,
+    ))
+
+
+async def _handle_delete(arguments: dict) -> List[TextContent]:
+    """Handle journal_delete: delete one entry."""
+    entry_id = arguments["entry_id"]
+
+    if await asyncio.to_thread(db.delete_entry, entry_id):
+        return _text(f"✅ Deleted journal entry {entry_id}")
+    else:
+        return _text(f"❌ Entry {entry_id} not found")
+
+
+async def _handle_delete_by_project(arguments: dict) -> List[TextContent]:
+    """Handle journal_delete_by_project: delete a project's entries."""
+    project = arguments["project"]
+    count = await asyncio.to_thread(db.delete_by_project, project)
+
+    return _text(f"✅ Deleted {count} entries for project '{project}'")
+
+
+async def _handle_import(arguments: dict) -> List[TextContent]:
+    """Handle journal_import: merge another journal file."""
+    file_path = arguments["file_path"]
+    imported = await asyncio.to_thread(db.import_from_db, file_path)
+
+    return _text(f"✅ Imported {imported} new entries from {file_path}")
+
+
+async def _handle_export(arguments: dict) -> List[TextContent]:
+    """Handle journal_export: write the journal to a file."""
+    file_path = await asyncio.to_thread(db.export_to_db, arguments.get("file_path"))
+
+    return _text(f"✅ Exported journal to {file_path}")
+
+
+# Tool name -> handler, looked up once per call
+_HANDLERS: Dict[str, Callable[[dict], Awaitable[List[TextContent]]]] = {
+    "journal_add": _handle_add,
+    "journal_auto_capture": _handle_auto_capture,
+    "journal_search": _handle_search,
+    "journal_time_query": _handle_time_query,
+    "journal_list_recent": _handle_list_recent,
+    "journal_list_projects": _handle_list_projects,
+    "journal_stats": _handle_stats,
+    "journal_delete": _handle_delete,
+    "journal_delete_by_project": _handle_delete_by_project,
+    "journal_import": _handle_import,
+    "journal_export": _handle_export,
+}
 
 
 @app.call_tool()
 async def call_tool(name: str, arguments: dict) -> List[TextContent]:
     """Handle tool calls."""
+    handler = _HANDLERS.get(name)
+    if handler is None:
+        return _text(f"❌ Unknown tool: {name}")
 
     try:
-        if name == "journal_add":
-            entry_id = db.add_entry(
-                title=arguments["title"],
-                description=arguments["description"],
-                project=arguments.get("project"),
-                tags=arguments.get("tags")
-            )
-            return [TextContent(
-                type="text",
-                text=f"✅ Journal entry created (ID: {entry_id})"
-            )]
-
-        elif name == "journal_auto_capture":
-            entry_id = db.add_entry(
-                title=arguments["title"],
-                description=arguments["description"],
-                project=arguments.get("project"),
-                tags=["auto-capture"] + (arguments.get("tags") or [])
-            )
-            return [TextContent(
-                type="text",
-                text=f"📝 Auto-captured to journal (ID: {entry_id})"
-            )]
-
-        elif name == "journal_search":
-            results = db.search(
-                query=arguments["query"],
-                project=arguments.get("project"),
-                limit=arguments.get("limit", 20)
-            )
-
-            if not results:
-                return [TextContent(
-                    type="text",
-                    text=f"No entries found matching '{arguments['query']}'"
-                )]
-
-            formatted = format_entries(results)
-            return [TextContent(type="text", text=formatted)]
-
-        elif name == "journal_time_query":
-            start_date, end_date = parse_time_expression(arguments["time_expression"])
-
-            results = db.get_by_time_range(
-                start_date=start_date,
-                end_date=end_date,
-                query=arguments.get("query"),
-                project=arguments.get("project")
-            )
-
-            if not results:
-                return [TextContent(
-                    type="text",
-                    text=f"No entries found for '{arguments['time_expression']}'"
-                )]
-
-            formatted = format_entries(results, show_time=arguments["time_expression"])
-            return [TextContent(type="text", text=formatted)]
-
-        elif name == "journal_list_recent":
-            results = db.list_recent(
-                limit=arguments.get("limit", 10),
-                project=arguments.get("project")
-            )
-
-            if not results:
-                return [TextContent(
-                    type="text",
-                    text="No journal entries found"
-                )]
-
-            formatted = format_entries(results)
-            return [TextContent(type="text", text=formatted)]
-
-        elif name == "journal_list_projects":
-            projects = db.list_projects()
-
-            if not projects:
-                return [TextContent(
-                    type="text",
-                    text="No projects found in journal"
-                )]
-
-            formatted = "**Projects:**\n\n"
-            for p in projects:
-                formatted += f"- {p['project']}: {p['count']} entries\n"
-
-            return [TextContent(type="text", text=formatted)]
-
-        elif name == "journal_stats":
-            stats = db.get_stats()
-
-            formatted = f"""**Journal Statistics:**
-
-Total Entries: {stats['total_entries']}
-First Entry: {stats['first_entry'] or 'N/A'}
-Last Entry: {stats['last_entry'] or 'N/A'}
-Total Projects: {stats['total_projects']}
+        return await handler(arguments)
+    except KeyError as e:
+        return _text(f"❌ Invalid arguments: missing {e}")
+    except (ValueError, OSError, sqlite3.Error) as e:
+        # Bad dates, missing files and unreadable databases are the
+        # caller's to fix, so the message is passed through
+        return _text(f"{_ERR_PREFIX}{e}")
+    except Exception:
+        logger.exception("Tool %s failed", name)
+        return _INTERNAL_ERROR
 
-**Entries per Project:**
-"""
-            if stats['entries_per_project']:
-                for p in stats['entries_per_project']:
-                    formatted += f"- {p['project']}: {p['count']}\n"
-            else:
-                formatted += "No projects tracked\n"
-
-            return [TextContent(type="text", text=formatted)]
-
-        elif name == "journal_delete":
-            deleted = db.delete_entry(arguments["entry_id"])
-
-            if deleted:
-                return [TextContent(
-                    type="text",
-                    text=f"✅ Deleted journal entry {arguments['entry_id']}"
-                )]
-            else:
-                return [TextContent(
-                    type="text",
-                    text=f"❌ Entry {arguments['entry_id']} not found"
-                )]
-
-        elif name == "journal_delete_by_project":
-            count = db.delete_by_project(arguments["project"])
-
-            return [TextContent(
-                type="text",
-                text=f"✅ Deleted {count} entries for project '{arguments['project']}'"
-            )]
-
-        elif name == "journal_import":
-            imported = db.import_from_db(arguments["file_path"])
-
-            return [TextContent(
-                type="text",
-                text=f"✅ Imported {imported} new entries from {arguments['file_path']}"
-            )]
-
-        elif name == "journal_export":
-            file_path = db.export_to_db(arguments.get("file_path"))
-
-            return [TextContent(
-                type="text",
-                text=f"✅ Exported journal to {file_path}"
-            )]
-
-        else:
-            return [TextContent(
-                type="text",
-                text=f"❌ Unknown tool: {name}"
-            )]
-
-    except Exception as e:
-        return [TextContent(
-            type="text",
-            text=f"❌ Error: {str(e)}"
-        )]
-
-
-def format_entries(entries: List[dict], show_time: Optional[str] = None) -> str:
+
+# Constant fragments of each formatted entry
+_DATE_PREFIX = "\n📅 "
+_PROJ_PREFIX = " | 📁 "
+_TAG_PREFIX = " | 🏷️ "
+
+
+def format_entries(entries: List[sqlite3.Row], show_time: Optional[str] = None) -> str:
     """Format journal entries for display."""
     header = f"**Journal Entries"
     if show_time:
         header += f" ({show_time})"
     header += f":** ({len(entries)} found)\n\n"
 
-    formatted = header
+    parts = [header]
 
+    append = parts.append
     for entry in entries:
-        formatted += f"**[{entry['id']}]** {entry['title']}\n"
-        formatted += f"📅 {entry['created_at']}"
-
+        append(f"**[{entry['id']}]** {entry['title']}")
+        append(_DATE_PREFIX + entry['created_at'])
         if entry['project']:
-            formatted += f" | 📁 {entry['project']}"
-
+            append(_PROJ_PREFIX + entry['project'])
         if entry['tags']:
-            formatted += f" | 🏷️ {entry['tags']}"
-
-        formatted += f"\n{entry['description']}\n\n"
+            append(_TAG_PREFIX + entry['tags'])
+        append(f"\n{entry['description']}\n\n")
 
-    return formatted
+    return "".join(parts)
 
 
 async def main():
     """Run the MCP server."""
     from mcp.server.stdio import stdio_server
 
+    # Each request runs in its own task. Eager tasks run at once, so
+    # requests that never touch the database (list_tools, unknown tools,
+    # missing arguments) finish without waiting a loop iteration, and
+    # tool calls reach their worker thread sooner.
+    asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     async with stdio_server() as (read_stream, write_stream):
         await app.run(
             read_stream,
@@ -413,5 +463,17 @@ async def main():
         )
 
 
+def run():
+    """Run the server on uvloop when it is installed, else the default loop."""
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+        return
+
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        runner.run(main())
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    run()
@@ -1,10 +1,30 @@
 """Natural language time parsing for journal queries."""
 
 from datetime import datetime, timedelta
-from typing import Tuple
+from functools import lru_cache
+from typing import Callable, Dict, Tuple
 import re
 
 
+# Relative, month-name and ISO-date expressions share one prefix match;
+# the named group that participated says which form it was
+_EXPRESSION_RE = re.compile(
+    r"last (?P<count>\d+) (?P<unit>day|days|week|weeks|month|months)"
+    r"|(?P<month>january|february|march|april|may|june|july|august|september|october|november|december)(?:\s+(?P<year>\d{4}))?"
+    r"|(?P<iso_year>\d{4})-(?P<iso_month>\d{2})-(?P<iso_day>\d{2})"
+)
+
+# Every _EXPRESSION_RE match starts with "last", a month name or a digit
+_EXPRESSION_STARTS = frozenset("ljfmasond0123456789")
+
+# Month names
+_MONTHS = {
+    "january": 1, "february": 2, "march": 3, "april": 4,
+    "may": 5, "june": 6, "july": 7, "august": 8,
+    "september": 9, "october": 10, "november": 11, "december": 12
+}
+
+
 def _format_sqlite_timestamp(dt: datetime) -> str:
     """Format datetime to SQLite timestamp format.
 
@@ -20,6 +40,73 @@ def _format_sqlite_timestamp(dt: datetime) -> str:
     return dt.strftime('%Y-%m-%d %H:%M:%S')
 
 
+def _day_range(start: datetime, end: datetime) -> Tuple[str, str]:
+    """Expand start/end to whole days and format them for SQLite."""
+    start = start.replace(hour=0, minute=0, second=0, microsecond=0)
+    end = end.replace(hour=23, minute=59, second=59, microsecond=999999)
+    return _format_sqlite_timestamp(start), _format_sqlite_timestamp(end)
+
+
+def _today(now: datetime) -> Tuple[str, str]:
+    """Today, midnight to end of day."""
+    return _day_range(now, now)
+
+
+def _yesterday(now: datetime) -> Tuple[str, str]:
+    """The whole of yesterday."""
+    yesterday = now - timedelta(days=1)
+    return _day_range(yesterday, yesterday)
+
+
+def _this_week(now: datetime) -> Tuple[str, str]:
+    """Monday of this week through today."""
+    return _day_range(now - timedelta(days=now.weekday()), now)
+
+
+def _last_week(now: datetime) -> Tuple[str, str]:
+    """Monday through Sunday of the previous week."""
+    end = now - timedelta(days=now.weekday() + 1)
+    return _day_range(end - timedelta(days=6), end)
+
+
+def _last_month(now: datetime) -> Tuple[str, str]:
+    """The whole previous calendar month."""
+    # Go back one day from the first of this month to the end of last month
+    end = now.replace(day=1) - timedelta(days=1)
+    return _day_range(end.replace(day=1), end)
+
+
+def _last_year(now: datetime) -> Tuple[str, str]:
+    """The whole previous calendar year."""
+    return _day_range(datetime(now.year - 1, 1, 1), datetime(now.year - 1, 12, 31))
+
+
+def _this_month(now: datetime) -> Tuple[str, str]:
+    """The first of this month through today."""
+    return _day_range(now.replace(day=1), now)
+
+
+def _this_year(now: datetime) -> Tuple[str, str]:
+    """January 1st through today."""
+    return _day_range(datetime(now.year, 1, 1), now)
+
+
+# Fixed expressions resolved with a single dict lookup
+_FIXED: Dict[str, Callable[[datetime], Tuple[str, str]]] = {
+    "today": _today,
+    "yesterday": _yesterday,
+    "this week": _this_week,
+    "current week": _this_week,
+    "last week": _last_week,
+    "last month": _last_month,
+    "last year": _last_year,
+    "this month": _this_month,
+    "current month": _this_month,
+    "this year": _this_year,
+    "current year": _this_year,
+}
+
+
 def parse_time_expression(expression: str) -> Tuple[str, str]:
     """Parse natural language time expression to date range.
 
@@ -37,35 +124,27 @@ def parse_time_expression(expression: str) -> Tuple[str, str]:
         >>> parse_time_expression("last week")
         ('2024-01-01T00:00:00', '2024-01-08T23:59:59')
     """
-    expression = expression.lower().strip()
-    now = datetime.now()
+    # Every range is widened to whole days, so the current minute is a
+    # precise enough "now" and results can be reused within it
+    now = datetime.now().replace(second=0, microsecond=0)
+    return _parse_time_expression(expression.lower().strip(), now)
 
-    # Today
-    if expression == "today":
-        start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        end = now.replace(hour=23, minute=59, second=59, microsecond=999999)
-        return _format_sqlite_timestamp(start), _format_sqlite_timestamp(end)
 
-    # Yesterday
-    if expression == "yesterday":
-        yesterday = now - timedelta(days=1)
-        start = yesterday.replace(hour=0, minute=0, second=0, microsecond=0)
-        end = yesterday.replace(hour=23, minute=59, second=59, microsecond=999999)
-        return _format_sqlite_timestamp(start), _format_sqlite_timestamp(end)
+@lru_cache(maxsize=512)
+def _parse_time_expression(expression: str, now: datetime) -> Tuple[str, str]:
+    """Resolve a normalized expression relative to now (see parse_time_expression)."""
+    handler = _FIXED.get(expression)
+    if handler is not None:
+        return handler(now)
 
-    # This week
-    if expression in ["this week", "current week"]:
-        start = now - timedelta(days=now.weekday())
-        start = start.replace(hour=0, minute=0, second=0, microsecond=0)
-        end = now.replace(hour=23, minute=59, second=59, microsecond=999999)
-        return _format_sqlite_timestamp(start), _format_sqlite_timestamp(end)
+    match = None
+    if expression[:1] in _EXPRESSION_STARTS:
+        match = _EXPRESSION_RE.match(expression)
 
     # Last N days/weeks/months
-    last_n_pattern = r"last (\d+) (day|days|week|weeks|month|months)"
-    match = re.match(last_n_pattern, expression)
-    if match:
-        count = int(match.group(1))
-        unit = match.group(2)
+    if match and match.group("count"):
+        count = int(match.group("count"))
+        unit = match.group("unit")
 
         if "day" in unit:
             start = now - timedelta(days=count)
@@ -79,54 +158,10 @@ def parse_time_expression(expression: str) -> Tuple[str, str]:
         end = now.replace(hour=23, minute=59, second=59, microsecond=999999)
         return _format_sqlite_timestamp(start), _format_sqlite_timestamp(end)
 
-    # Last week/month/year
-    if expression == "last week":
-        end = now - timedelta(days=now.weekday() + 1)
-        start = end - timedelta(days=6)
-        start = start.replace(hour=0, minute=0, second=0, microsecond=0)
-        end = end.replace(hour=23, minute=59, second=59, microsecond=999999)
-        return _format_sqlite_timestamp(start), _format_sqlite_timestamp(end)
-
-    if expression == "last month":
-        # Go to first day of current month
-        first_of_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        # Go back one day to get last day of previous month
-        end = first_of_month - timedelta(days=1)
-        # Get first day of previous month
-        start = end.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        end = end.replace(hour=23, minute=59, second=59, microsecond=999999)
-        return _format_sqlite_timestamp(start), _format_sqlite_timestamp(end)
-
-    if expression == "last year":
-        start = datetime(now.year - 1, 1, 1, 0, 0, 0)
-        end = datetime(now.year - 1, 12, 31, 23, 59, 59, 999999)
-        return _format_sqlite_timestamp(start), _format_sqlite_timestamp(end)
-
-    # This month/year
-    if expression in ["this month", "current month"]:
-        start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        end = now.replace(hour=23, minute=59, second=59, microsecond=999999)
-        return _format_sqlite_timestamp(start), _format_sqlite_timestamp(end)
-
-    if expression in ["this year", "current year"]:
-        start = datetime(now.year, 1, 1, 0, 0, 0)
-        end = now.replace(hour=23, minute=59, second=59, microsecond=999999)
-        return _format_sqlite_timestamp(start), _format_sqlite_timestamp(end)
-
-    # Month names
-    months = {
-        "january": 1, "february": 2, "march": 3, "april": 4,
-        "may": 5, "june": 6, "july": 7, "august": 8,
-        "september": 9, "october": 10, "november": 11, "december": 12
-    }
-
     # Month with optional year (e.g., "january" or "january 2024")
-    month_pattern = r"(january|february|march|april|may|june|july|august|september|october|november|december)(?:\s+(\d{4}))?"
-    match = re.match(month_pattern, expression)
-    if match:
-        month_name = match.group(1)
-        year = int(match.group(2)) if match.group(2) else now.year
-        month = months[month_name]
+    if match and match.group("month"):
+        year = int(match.group("year")) if match.group("year") else now.year
+        month = _MONTHS[match.group("month")]
 
         start = datetime(year, month, 1, 0, 0, 0)
 
@@ -141,10 +176,10 @@ def parse_time_expression(expression: str) -> Tuple[str, str]:
         return _format_sqlite_timestamp(start), _format_sqlite_timestamp(end)
 
     # ISO date format (YYYY-MM-DD)
-    iso_date_pattern = r"(\d{4})-(\d{2})-(\d{2})"
-    match = re.match(iso_date_pattern, expression)
     if match:
-        year, month, day = int(match.group(1)), int(match.group(2)), int(match.group(3))
+        year = int(match.group("iso_year"))
+        month = int(match.group("iso_month"))
+        day = int(match.group("iso_day"))
         start = datetime(year, month, day, 0, 0, 0)
         end = datetime(year, month, day, 23, 59, 59, 999999)
         return _format_sqlite_timestamp(start), _format_sqlite_timestamp(end)
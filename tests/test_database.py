@@ -1,81 +1,130 @@
 """Tests for database operations."""
 
+import asyncio
 import pytest
-import tempfile
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timedelta
-from claude_journal.database import JournalDatabase
+from claude_journal.database import JournalDatabase, _parse_query
 
 
 @pytest.fixture
 def temp_db():
-    """Create a temporary database for testing."""
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        db_path = f.name
+    """Create an in-memory database for testing."""
+    db = JournalDatabase(":memory:")
+    yield db
+
+    db.close()
+
+
+@pytest.fixture
+def file_db(tmp_path):
+    """Create an on-disk database for behaviour memory databases lack."""
+    db = JournalDatabase(tmp_path / "journal.db")
+    yield db
+
+    db.close()
+
+
+@pytest.fixture(scope="module")
+def _sample_db(tmp_path_factory):
+    """Build the sample database once per module; tests get copies."""
+    db = JournalDatabase(tmp_path_factory.mktemp("sample") / "sample.db")
+
+    # Add entries for multiple projects in one transaction
+    with db.batch():
+        db.add_entry(
+            title="Implemented OAuth2",
+            description="Built OAuth2 flow with JWT tokens",
+            project="my-app",
+            tags=["auth", "security"]
+        )
+
+        db.add_entry(
+            title="Fixed cache memory leak",
+            description="Cache wasn't clearing old entries",
+            project="api-service",
+            tags=["bugfix", "performance"]
+        )
+
+        db.add_entry(
+            title="Added rate limiting",
+            description="Rate limiting with Redis backend",
+            project="my-app",
+            tags=["api", "redis"]
+        )
+
+        db.add_entry(
+            title="Database migration",
+            description="Migrated from MySQL to PostgreSQL",
+            project="api-service",
+            tags=["database", "migration"]
+        )
+
+        db.add_entry(
+            title="Setup CI/CD pipeline",
+            description="GitHub Actions for tests and deployment",
+            project="my-app",
+            tags=["ci", "deployment"]
+        )
 
-    db = JournalDatabase(db_path)
     yield db
 
     db.close()
-    Path(db_path).unlink()
+
+
+@pytest.fixture(scope="module")
+def time_bounds(_sample_db):
+    """Earliest and latest created_at of the sample entries."""
+    # Every populated_db is a copy of _sample_db, so this holds for all of them
+    return tuple(_sample_db.conn.execute(
+        "SELECT MIN(created_at), MAX(created_at) FROM journal_entries"
+    ).fetchone())
 
 
 @pytest.fixture
-def populated_db(temp_db):
+def populated_db(temp_db, _sample_db):
     """Create a database with sample data."""
-    # Add entries for multiple projects
-    temp_db.add_entry(
-        title="Implemented OAuth2",
-        description="Built OAuth2 flow with JWT tokens",
-        project="my-app",
-        tags=["auth", "security"]
-    )
-
-    temp_db.add_entry(
-        title="Fixed cache memory leak",
-        description="Cache wasn't clearing old entries",
-        project="api-service",
-        tags=["bugfix", "performance"]
-    )
-
-    temp_db.add_entry(
-        title="Added rate limiting",
-        description="Rate limiting with Redis backend",
-        project="my-app",
-        tags=["api", "redis"]
-    )
-
-    temp_db.add_entry(
-        title="Database migration",
-        description="Migrated from MySQL to PostgreSQL",
-        project="api-service",
-        tags=["database", "migration"]
-    )
-
-    temp_db.add_entry(
-        title="Setup CI/CD pipeline",
-        description="GitHub Actions for tests and deployment",
-        project="my-app",
-        tags=["ci", "deployment"]
-    )
-
+    # Copying the prebuilt pages is cheaper than replaying the inserts
+    _sample_db.conn.backup(temp_db.conn)
     return temp_db
 
 
+def _count(db, table="journal_entries", **where):
+    """Count rows of a table matching column=value conditions."""
+    sql = f"SELECT COUNT(*) FROM {table} WHERE 1=1"
+    for column in where:
+        sql += f" AND {column} = ?"
+    return db.conn.execute(sql, tuple(where.values())).fetchone()[0]
+
+
+def _plan_of(db, call):
+    """Return the query plan of the SELECT a database call executes."""
+    statements = []
+    db.conn.set_trace_callback(statements.append)
+    try:
+        call()
+    finally:
+        db.conn.set_trace_callback(None)
+
+    # The trace holds the statement with its parameters filled in; lines
+    # starting with "--" are SQLite's own internal queries
+    sql = [s for s in statements if s.lstrip().startswith("SELECT")][-1]
+    cursor = db.conn.execute("EXPLAIN QUERY PLAN " + sql)
+    return " ".join(row[3] for row in cursor.fetchall())
+
+
 class TestDatabaseInit:
     """Test database initialization."""
 
-    def test_init_creates_database(self):
+    def test_init_creates_database(self, tmp_path):
         """Test that database file is created."""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-            db_path = f.name
-
-        Path(db_path).unlink()  # Delete it first
+        db_path = tmp_path / "journal.db"
 
         db = JournalDatabase(db_path)
-        assert Path(db_path).exists()
+        assert db_path.exists()
         db.close()
-        Path(db_path).unlink()
 
     def test_init_creates_tables(self, temp_db):
         """Test that tables are created."""
@@ -84,6 +133,7 @@ class TestDatabaseInit:
         )
         tables = [row[0] for row in cursor.fetchall()]
         assert "journal_entries" in tables
+        assert "journal_tags" in tables
 
     def test_init_creates_indexes(self, temp_db):
         """Test that indexes are created."""
@@ -92,7 +142,125 @@ class TestDatabaseInit:
         )
         indexes = [row[0] for row in cursor.fetchall()]
         assert "idx_created_at" in indexes
-        assert "idx_project" in indexes
+        assert "idx_project_created" in indexes
+        assert "idx_dedup" in indexes
+
+    def test_entry_id_is_rowid(self, populated_db):
+        """Test that entry ids alias the rowid the FTS index is keyed on."""
+        sql = populated_db.conn.execute(
+            "SELECT sql FROM sqlite_master WHERE name = 'journal_entries'"
+        ).fetchone()[0]
+        assert "WITHOUT ROWID" not in sql.upper()
+
+        cursor = populated_db.conn.execute(
+            "SELECT COUNT(*) FROM journal_entries WHERE id != rowid"
+        )
+        assert cursor.fetchone()[0] == 0
+
+    def test_list_recent_by_project_avoids_sort(self, populated_db):
+        """Test that project-filtered recency queries need no temp sort."""
+        cursor = populated_db.conn.execute(
+            "EXPLAIN QUERY PLAN " + JournalDatabase._SQL_RECENT_BY_PROJECT,
+            ("my-app", 10)
+        )
+        plan = " ".join(row[3] for row in cursor.fetchall())
+        assert "idx_project_created" in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_rows_are_sqlite_rows(self, populated_db):
+        """Test that query results are sqlite3.Row objects, not copies."""
+        row = next(populated_db.iter_recent(limit=1))
+        assert type(row) is sqlite3.Row
+        assert row["title"] == "Setup CI/CD pipeline"
+
+    def test_init_applies_pragmas(self, file_db):
+        """Test that connection tuning pragmas are applied."""
+        conn = file_db.conn
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+        assert conn.execute("PRAGMA mmap_size").fetchone()[0] == 268435456
+
+    def test_memory_db_applies_pragmas(self, temp_db):
+        """Test that in-memory test databases get the same tuning."""
+        conn = temp_db.conn
+        # WAL doesn't apply to memory databases; the rest still does
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+
+    def test_init_analyzes_database(self, tmp_path):
+        """Test that planner statistics for entries are collected on open."""
+        db_path = tmp_path / "journal.db"
+
+        db = JournalDatabase(db_path)
+        for i in range(20):
+            db.add_entry(title=f"Entry {i}", description="Body", project=f"p{i % 3}")
+        db.close()
+
+        db = JournalDatabase(db_path)
+        cursor = db.conn.execute(
+            "SELECT idx FROM sqlite_stat1 WHERE tbl = 'journal_entries'"
+        )
+        indexes = {row[0] for row in cursor.fetchall()}
+        assert "idx_project_created" in indexes
+        db.close()
+
+    def test_close_twice(self, temp_db):
+        """Test that closing an already closed database is harmless."""
+        temp_db.close()
+        temp_db.close()
+
+    def test_init_creates_fts_index(self, temp_db):
+        """Test that the full-text index and sync triggers are created."""
+        cursor = temp_db.conn.execute(
+            "SELECT name, type FROM sqlite_master WHERE name LIKE 'journal_entries_%'"
+        )
+        objects = {row[0]: row[1] for row in cursor.fetchall()}
+        assert objects["journal_entries_fts"] == "table"
+        assert objects["journal_entries_ai"] == "trigger"
+        assert objects["journal_entries_ad"] == "trigger"
+        assert objects["journal_entries_au"] == "trigger"
+
+    def test_init_indexes_existing_tags(self, tmp_path):
+        """Test that tags of entries from older versions are filterable."""
+        db_path = tmp_path / "journal.db"
+
+        db = JournalDatabase(db_path)
+        db.add_entry(title="Tagged", description="Has tags", tags=["alpha", "beta"])
+        db.conn.execute("DROP TABLE journal_tags")
+        db.conn.commit()
+        db.close()
+
+        db = JournalDatabase(db_path)
+        assert len(db.search("tag:beta")) == 1
+        db.close()
+
+    def test_init_indexes_existing_entries(self, tmp_path):
+        """Test that entries written before the FTS index existed are searchable."""
+        db_path = tmp_path / "journal.db"
+
+        conn = sqlite3.connect(db_path)
+        conn.execute("""
+            CREATE TABLE journal_entries (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                created_at TEXT NOT NULL DEFAULT (datetime('now')),
+                project TEXT,
+                title TEXT NOT NULL,
+                description TEXT NOT NULL,
+                tags TEXT
+            )
+        """)
+        conn.execute(
+            "INSERT INTO journal_entries (title, description) VALUES (?, ?)",
+            ("Legacy entry", "Written by an older version")
+        )
+        conn.commit()
+        conn.close()
+
+        db = JournalDatabase(db_path)
+        results = db.search("legacy")
+        assert len(results) == 1
+        db.close()
 
 
 class TestAddEntry:
@@ -106,6 +274,14 @@ class TestAddEntry:
         )
         assert entry_id > 0
 
+    def test_add_entry_returns_stored_id(self, temp_db):
+        """Test that the returned ID identifies the stored entry."""
+        first_id = temp_db.add_entry(title="First", description="One")
+        second_id = temp_db.add_entry(title="Second", description="Two")
+
+        assert second_id == first_id + 1
+        assert temp_db.search(f"id:{second_id}")[0]["title"] == "Second"
+
     def test_add_entry_with_project(self, temp_db):
         """Test adding entry with project."""
         entry_id = temp_db.add_entry(
@@ -114,8 +290,8 @@ class TestAddEntry:
             project="test-project"
         )
 
-        entries = temp_db.list_recent(limit=1)
-        assert entries[0]["project"] == "test-project"
+        entry = next(temp_db.iter_recent(limit=1))
+        assert entry["project"] == "test-project"
 
     def test_add_entry_with_tags(self, temp_db):
         """Test adding entry with tags."""
@@ -125,8 +301,8 @@ class TestAddEntry:
             tags=["tag1", "tag2", "tag3"]
         )
 
-        entries = temp_db.list_recent(limit=1)
-        assert entries[0]["tags"] == "tag1,tag2,tag3"
+        entry = next(temp_db.iter_recent(limit=1))
+        assert entry["tags"] == "tag1,tag2,tag3"
 
     def test_add_entry_auto_timestamp(self, temp_db):
         """Test that timestamp is automatically set."""
@@ -144,6 +320,55 @@ class TestAddEntry:
         assert abs((now - created_at).total_seconds()) < 5  # Within 5 seconds
 
 
+class TestBatch:
+    """Test grouping writes into one transaction."""
+
+    def test_batch_commits_all_entries(self, temp_db):
+        """Test that entries added in a batch are committed together."""
+        with temp_db.batch():
+            for i in range(3):
+                temp_db.add_entry(title=f"Entry {i}", description="Batched")
+            assert temp_db.conn.in_transaction
+
+        assert not temp_db.conn.in_transaction
+        assert len(temp_db.list_recent()) == 3
+
+    def test_batch_rolls_back_on_error(self, temp_db):
+        """Test that a failing batch leaves no partial writes."""
+        with pytest.raises(RuntimeError):
+            with temp_db.batch():
+                temp_db.add_entry(title="Entry", description="Batched")
+                raise RuntimeError("boom")
+
+        assert temp_db.list_recent() == []
+
+        # Writes after the batch commit normally again
+        temp_db.add_entry(title="Entry", description="Not batched")
+        assert not temp_db.conn.in_transaction
+
+    def test_batch_refused_on_event_loop(self, temp_db):
+        """Test that a batch can't hold the lock on an event loop thread."""
+        async def open_batch():
+            with temp_db.batch():
+                temp_db.add_entry(title="Entry", description="Batched")
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(open_batch())
+        assert not temp_db.conn.in_transaction
+        assert temp_db.list_recent() == []
+
+
+class TestThreading:
+    """Test use of the connection from worker threads."""
+
+    def test_search_from_another_thread(self, populated_db):
+        """Test that the connection can be used outside its creating thread."""
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(populated_db.search, ["OAuth2"] * 8))
+
+        assert all(len(r) == 1 for r in results)
+
+
 class TestSearch:
     """Test search functionality."""
 
@@ -184,6 +409,73 @@ class TestSearch:
         results = populated_db.search("", limit=2)
         assert len(results) == 2
 
+    def test_search_multiple_keywords(self, populated_db):
+        """Test that all keywords must match."""
+        results = populated_db.search("rate redis")
+        assert len(results) == 1
+        assert results[0]["title"] == "Added rate limiting"
+
+        results = populated_db.search("limiting postgresql")
+        assert len(results) == 0
+
+    def test_search_keyword_substring(self, populated_db):
+        """Test that keywords match inside words, as a LIKE search would."""
+        results = populated_db.search("auth")
+        assert len(results) == 1
+        assert results[0]["title"] == "Implemented OAuth2"
+
+        results = populated_db.search("migrat")
+        assert len(results) == 1
+        assert results[0]["title"] == "Database migration"
+
+    def test_search_short_keyword(self, populated_db):
+        """Test keywords shorter than a trigram still match."""
+        titles = [r["title"] for r in populated_db.search("CI")]
+        assert "Setup CI/CD pipeline" in titles
+
+    def test_search_uses_fts_index(self, populated_db):
+        """Test that keyword search probes the trigram index."""
+        clause, params = populated_db._keyword_clause(["oauth"])
+        cursor = populated_db.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM journal_entries WHERE 1=1" + clause,
+            params
+        )
+        plan = " ".join(row[3] for row in cursor.fetchall())
+        assert "VIRTUAL TABLE INDEX" in plan
+
+    def test_search_project_filter_uses_fts(self, populated_db):
+        """Test that adding a project filter keeps the trigram index probe."""
+        plan = _plan_of(
+            populated_db, lambda: populated_db.search("oauth", project="my-app")
+        )
+        assert "VIRTUAL TABLE INDEX" in plan
+        assert "idx_project_created" in plan
+        assert "TEMP B-TREE" not in plan
+
+        results = populated_db.search("oauth", project="my-app")
+        assert [r["title"] for r in results] == ["Implemented OAuth2"]
+
+    def test_search_reflects_deletes(self, populated_db):
+        """Test that the full-text index stays in sync with deletes."""
+        entry_id = populated_db.search("OAuth2")[0]["id"]
+        populated_db.delete_entry(entry_id)
+        assert populated_db.search("OAuth2") == []
+
+    def test_search_without_fts(self, populated_db):
+        """Test the LIKE fallback used when FTS5 is unavailable."""
+        populated_db._fts_enabled = False
+
+        results = populated_db.search("oauth")
+        assert len(results) == 1
+        assert results[0]["title"] == "Implemented OAuth2"
+
+        results = populated_db.search("rate redis")
+        assert len(results) == 1
+
+        results = populated_db.search("performance")
+        assert len(results) == 1
+        assert results[0]["title"] == "Fixed cache memory leak"
+
     def test_search_no_results(self, populated_db):
         """Test search with no matches."""
         results = populated_db.search("nonexistent query xyz")
@@ -271,6 +563,16 @@ class TestSearch:
         found = any(r["id"] == entry_id1 for r in results)
         assert found
 
+    def test_parse_query_components(self):
+        """Test that query syntax is split into its components."""
+        tags, phrases, time_expression, keywords = _parse_query(
+            'tag:bugfix "login error" last month cache #auth'
+        )
+        assert tags == ("bugfix", "auth")
+        assert phrases == ("login error",)
+        assert time_expression == "last month"
+        assert keywords == ("cache",)
+
     def test_search_with_date_range(self, populated_db):
         """Test search with time expressions."""
         # Search with time keyword
@@ -305,54 +607,82 @@ class TestSearch:
         assert found_entry1
 
         # Should NOT find entry2 which only has "retest" (not "test")
-        # Note: This is a boundary case - our implementation uses LIKE with commas
-        # so it should handle this correctly
+        found_entry2 = any(r["id"] == entry2_id for r in results)
+        assert not found_entry2
+
+    def test_search_tag_case_insensitive(self, populated_db):
+        """Test that tag filters ignore case."""
+        results = populated_db.search("tag:PERFORMANCE")
+        assert len(results) == 1
+        assert results[0]["title"] == "Fixed cache memory leak"
 
 
 class TestTimeRange:
     """Test time range queries."""
 
-    def test_get_by_time_range(self, populated_db):
+    def test_get_by_time_range(self, populated_db, time_bounds):
         """Test getting entries by time range."""
-        # Get all entries to find the actual time range
-        all_entries = populated_db.list_recent(limit=10)
-
-        # Get earliest and latest timestamps
-        timestamps = [e["created_at"] for e in all_entries]
-        start = min(timestamps)
-        end = max(timestamps)
+        start, end = time_bounds
 
         results = populated_db.get_by_time_range(start, end)
         assert len(results) == 5  # All entries should be in range
 
-    def test_get_by_time_range_with_query(self, populated_db):
+    def test_get_by_time_range_with_query(self, populated_db, time_bounds):
         """Test time range with text query."""
-        # Get all entries to find the actual time range
-        all_entries = populated_db.list_recent(limit=10)
-        timestamps = [e["created_at"] for e in all_entries]
-        start = min(timestamps)
-        end = max(timestamps)
+        start, end = time_bounds
 
         results = populated_db.get_by_time_range(start, end, query="OAuth2")
         assert len(results) == 1
         assert results[0]["title"] == "Implemented OAuth2"
 
-    def test_get_by_time_range_with_project(self, populated_db):
+    def test_get_by_time_range_query_is_one_phrase(self, populated_db, time_bounds):
+        """Test that a multi-word text query must match contiguously."""
+        start, end = time_bounds
+
+        results = populated_db.get_by_time_range(start, end, query="rate limiting")
+        assert [r["title"] for r in results] == ["Added rate limiting"]
+
+        results = populated_db.get_by_time_range(start, end, query="limiting rate")
+        assert results == []
+
+    def test_get_by_time_range_with_project(self, populated_db, time_bounds):
         """Test time range with project filter."""
-        # Get all entries to find the actual time range
-        all_entries = populated_db.list_recent(limit=10)
-        timestamps = [e["created_at"] for e in all_entries]
-        start = min(timestamps)
-        end = max(timestamps)
+        start, end = time_bounds
 
         results = populated_db.get_by_time_range(start, end, project="my-app")
         assert len(results) == 3
         assert all(r["project"] == "my-app" for r in results)
 
+    def test_time_range_with_project_plan(self, populated_db, time_bounds):
+        """Test that a project-scoped range seeks idx_project_created."""
+        plan = _plan_of(
+            populated_db,
+            lambda: populated_db.get_by_time_range(*time_bounds, project="my-app")
+        )
+        assert "idx_project_created (project=? AND created_at>? AND created_at<?)" in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_time_range_seeks_created_at_index(self, populated_db, time_bounds):
+        """Test that text timestamps are range-scanned through the index."""
+        plan = _plan_of(
+            populated_db, lambda: populated_db.get_by_time_range(*time_bounds)
+        )
+        assert "idx_created_at (created_at>? AND created_at<?)" in plan
+        assert "TEMP B-TREE" not in plan
+
 
 class TestListRecent:
     """Test listing recent entries."""
 
+    def test_list_recent_plan_uses_index_no_sort(self, populated_db):
+        """Test that the newest-first listing walks idx_created_at."""
+        cursor = populated_db.conn.execute(
+            "EXPLAIN QUERY PLAN " + JournalDatabase._SQL_RECENT, (10,)
+        )
+        plan = " ".join(row[3] for row in cursor.fetchall())
+        assert "USING INDEX idx_created_at" in plan
+        assert "TEMP B-TREE" not in plan
+
     def test_list_recent_default(self, populated_db):
         """Test listing recent entries with default limit."""
         results = populated_db.list_recent()
@@ -363,6 +693,33 @@ class TestListRecent:
         results = populated_db.list_recent(limit=3)
         assert len(results) == 3
 
+    def test_iter_recent_streams_rows(self, populated_db):
+        """Test that iter_recent yields the same rows as list_recent."""
+        rows = populated_db.iter_recent(limit=2, project="my-app")
+        assert not isinstance(rows, list)
+        assert [r["id"] for r in rows] == [
+            r["id"] for r in populated_db.list_recent(limit=2, project="my-app")
+        ]
+
+    def test_iter_recent_holds_lock_until_closed(self, populated_db, tmp_path):
+        """Test that a half-read iterator keeps the connection to itself."""
+        rows = populated_db.iter_recent(limit=5)
+        next(rows)
+
+        def try_lock():
+            if populated_db._lock.acquire(blocking=False):
+                populated_db._lock.release()
+                return True
+            return False
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            assert not pool.submit(try_lock).result()
+
+        # Closing the iterator finishes its statement, so exports work again
+        rows.close()
+        export_path = populated_db.export_to_db(str(tmp_path / "export.db"))
+        assert Path(export_path).exists()
+
     def test_list_recent_ordered(self, populated_db):
         """Test that results are ordered by most recent."""
         results = populated_db.list_recent()
@@ -410,6 +767,24 @@ class TestStats:
         assert stats["last_entry"] is not None
         assert len(stats["entries_per_project"]) == 2
 
+    def test_get_stats_empty(self, temp_db):
+        """Test statistics for an empty journal."""
+        stats = temp_db.get_stats()
+
+        assert stats["total_entries"] == 0
+        assert stats["total_projects"] == 0
+        assert stats["first_entry"] is None
+        assert stats["last_entry"] is None
+        assert stats["entries_per_project"] == []
+
+    def test_get_stats_counts_entries_without_project(self, populated_db):
+        """Test that entries without a project count toward the total only."""
+        populated_db.add_entry(title="No project", description="Unfiled")
+        stats = populated_db.get_stats()
+
+        assert stats["total_entries"] == 6
+        assert stats["total_projects"] == 2
+
     def test_stats_entries_per_project(self, populated_db):
         """Test entries per project in stats."""
         stats = populated_db.get_stats()
@@ -424,16 +799,21 @@ class TestDelete:
 
     def test_delete_entry(self, populated_db):
         """Test deleting a specific entry."""
-        entries = populated_db.list_recent(limit=1)
-        entry_id = entries[0]["id"]
+        entry_id = next(populated_db.iter_recent(limit=1))["id"]
 
         result = populated_db.delete_entry(entry_id)
         assert result is True
 
         # Verify entry is gone
-        remaining = populated_db.list_recent()
-        assert len(remaining) == 4
-        assert entry_id not in [e["id"] for e in remaining]
+        assert _count(populated_db) == 4
+        assert _count(populated_db, id=entry_id) == 0
+
+    def test_delete_entry_removes_tags(self, populated_db):
+        """Test that deleting an entry also deletes its tag rows."""
+        entry_id = populated_db.search("tag:security")[0]["id"]
+        populated_db.delete_entry(entry_id)
+
+        assert _count(populated_db, "journal_tags", entry_id=entry_id) == 0
 
     def test_delete_entry_not_found(self, populated_db):
         """Test deleting non-existent entry."""
@@ -446,9 +826,8 @@ class TestDelete:
         assert count == 3
 
         # Verify entries are gone
-        remaining = populated_db.list_recent()
-        assert len(remaining) == 2
-        assert all(e["project"] == "api-service" for e in remaining)
+        assert _count(populated_db) == 2
+        assert _count(populated_db, project="my-app") == 0
 
     def test_delete_by_project_not_found(self, populated_db):
         """Test deleting project that doesn't exist."""
@@ -459,40 +838,97 @@ class TestDelete:
 class TestImportExport:
     """Test import/export functionality."""
 
-    def test_export_to_db(self, populated_db):
+    def test_export_to_db(self, populated_db, tmp_path):
         """Test exporting database."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            export_path = Path(tmpdir) / "export.db"
-            result_path = populated_db.export_to_db(str(export_path))
+        export_path = tmp_path / "export.db"
+        result_path = populated_db.export_to_db(str(export_path))
+
+        assert Path(result_path).exists()
+
+        # Verify exported database has data
+        exported_db = JournalDatabase(result_path)
+        entries = exported_db.list_recent()
+        assert len(entries) == 5
+        exported_db.close()
+
+    def test_export_is_exact_copy(self, populated_db, tmp_path):
+        """Test that the export carries every row and table intact."""
+        export_path = populated_db.export_to_db(str(tmp_path / "export.db"))
+
+        exported = sqlite3.connect(export_path)
+        assert exported.execute("PRAGMA integrity_check").fetchone()[0] == "ok"
+        for table in ("journal_entries", "journal_tags"):
+            query = f"SELECT COUNT(*) FROM {table}"
+            assert (exported.execute(query).fetchone()[0]
+                    == populated_db.conn.execute(query).fetchone()[0])
+        exported.close()
+
+    def test_export_with_backup_api(self, populated_db, tmp_path, monkeypatch):
+        """Test the backup API export used when VACUUM INTO is unavailable."""
+        monkeypatch.setattr(sqlite3, "sqlite_version_info", (3, 26, 0))
+        export_path = populated_db.export_to_db(str(tmp_path / "export.db"))
+
+        exported = sqlite3.connect(export_path)
+        count = exported.execute("SELECT COUNT(*) FROM journal_entries").fetchone()[0]
+        assert count == 5
+        exported.close()
+
+    def test_export_overwrites_existing_file(self, populated_db, tmp_path):
+        """Test that exporting over a previous export replaces it."""
+        export_path = tmp_path / "export.db"
+        populated_db.export_to_db(str(export_path))
+
+        populated_db.add_entry(title="Later entry", description="Added after export")
+        populated_db.export_to_db(str(export_path))
+
+        exported_db = JournalDatabase(str(export_path))
+        assert len(exported_db.list_recent()) == 6
+        exported_db.close()
 
-            assert Path(result_path).exists()
+    def test_export_onto_own_file_refused(self, file_db):
+        """Test that exporting over the live journal is refused."""
+        file_db.add_entry(title="Kept", description="Must survive the export")
 
-            # Verify exported database has data
-            exported_db = JournalDatabase(result_path)
-            entries = exported_db.list_recent()
-            assert len(entries) == 5
-            exported_db.close()
+        with pytest.raises(ValueError):
+            file_db.export_to_db(str(file_db.db_path))
 
-    def test_export_auto_filename(self, populated_db):
+        file_db.add_entry(title="Later", description="Written after the export")
+        reopened = JournalDatabase(file_db.db_path)
+        assert _count(reopened) == 2
+        reopened.close()
+
+    def test_failed_export_keeps_previous_file(self, populated_db, tmp_path):
+        """Test that an export that fails leaves the old export in place."""
+        export_path = tmp_path / "export.db"
+        populated_db.export_to_db(str(export_path))
+
+        # VACUUM can't run inside an open transaction
+        with pytest.raises(sqlite3.OperationalError):
+            with populated_db.batch():
+                populated_db.add_entry(title="Later", description="In a batch")
+                populated_db.export_to_db(str(export_path))
+
+        exported = sqlite3.connect(export_path)
+        count = exported.execute("SELECT COUNT(*) FROM journal_entries").fetchone()[0]
+        assert count == 5
+        exported.close()
+        assert [p.name for p in tmp_path.iterdir()] == ["export.db"]
+
+    def test_export_auto_filename(self, populated_db, tmp_path, monkeypatch):
         """Test export with auto-generated filename."""
+        # The default name is relative to the working directory
+        monkeypatch.chdir(tmp_path)
         result_path = populated_db.export_to_db()
 
         assert Path(result_path).exists()
         assert "journal_export_" in result_path
 
-        # Clean up
-        Path(result_path).unlink()
-
-    def test_import_from_db(self, populated_db):
+    def test_import_from_db(self, populated_db, file_db, tmp_path):
         """Test importing from another database."""
-        # Create a new empty database
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-            new_db_path = f.name
-
-        new_db = JournalDatabase(new_db_path)
+        new_db = file_db
 
         # Export populated_db
-        export_path = populated_db.export_to_db("test_export.db")
+        export_path = populated_db.export_to_db(str(tmp_path / "test_export.db"))
 
         # Import into empty new_db
         count = new_db.import_from_db(export_path)
@@ -502,15 +938,13 @@ class TestImportExport:
         entries = new_db.list_recent()
         assert len(entries) == 5
 
-        # Clean up
-        new_db.close()
-        Path(new_db_path).unlink()
-        Path(export_path).unlink()
+        # Imported tags are filterable
+        assert len(new_db.search("tag:redis")) == 1
 
-    def test_import_avoids_duplicates(self, populated_db):
+    def test_import_avoids_duplicates(self, populated_db, tmp_path):
         """Test that importing avoids duplicate entries."""
         # Export database
-        export_path = populated_db.export_to_db("test_export.db")
+        export_path = populated_db.export_to_db(str(tmp_path / "test_export.db"))
 
         # Import into same database (should skip duplicates)
         count = populated_db.import_from_db(export_path)
@@ -520,8 +954,88 @@ class TestImportExport:
         entries = populated_db.list_recent()
         assert len(entries) == 5
 
-        # Clean up
-        Path(export_path).unlink()
+    def test_import_is_single_statement(self, populated_db, file_db, tmp_path):
+        """Test that import copies all rows with one INSERT ... SELECT."""
+        export_path = populated_db.export_to_db(str(tmp_path / "test_export.db"))
+
+        statements = []
+        file_db.conn.set_trace_callback(statements.append)
+        assert file_db.import_from_db(export_path) == 5
+        file_db.conn.set_trace_callback(None)
+
+        # Trigger steps re-trace their parent statement, so compare the
+        # distinct statement texts rather than counting them
+        inserts = {s for s in statements if "INTO journal_entries (" in s}
+        assert inserts == {JournalDatabase._SQL_IMPORT}
+
+    def test_import_indexes_new_entries(self, populated_db, file_db, tmp_path):
+        """Test that bulk-loaded entries reach the FTS index exactly once."""
+        file_db.add_entry(title="Existing entry", description="Already indexed")
+        export_path = populated_db.export_to_db(str(tmp_path / "test_export.db"))
+        assert file_db.import_from_db(export_path) == 5
+
+        conn = file_db.conn
+        indexed = conn.execute(
+            "SELECT COUNT(*) FROM journal_entries_fts_docsize"
+        ).fetchone()[0]
+        assert indexed == _count(file_db) == 6
+        conn.execute(
+            "INSERT INTO journal_entries_fts(journal_entries_fts) VALUES ('integrity-check')"
+        )
+        assert len(file_db.search("OAuth2")) == 1
+
+        # The insert trigger is back for later entries
+        file_db.add_entry(title="After import", description="Trigger restored")
+        assert len(file_db.search("restored")) == 1
+
+    def test_import_takes_write_lock_first(self, populated_db, file_db, tmp_path):
+        """Test that no other writer can commit while an import reads."""
+        export_path = populated_db.export_to_db(str(tmp_path / "test_export.db"))
+        other = sqlite3.connect(file_db.db_path, timeout=0, isolation_level=None)
+        blocked = []
+
+        def try_write(statement):
+            if "MAX(id)" in statement:
+                try:
+                    other.execute("BEGIN IMMEDIATE")
+                    other.execute("ROLLBACK")
+                    blocked.append(False)
+                except sqlite3.OperationalError:
+                    blocked.append(True)
+
+        file_db.conn.set_trace_callback(try_write)
+        assert file_db.import_from_db(export_path) == 5
+        file_db.conn.set_trace_callback(None)
+        other.close()
+
+        assert blocked == [True]
+
+    def test_failed_import_keeps_index_trigger(self, file_db, tmp_path):
+        """Test that an aborted import leaves the FTS insert trigger in place."""
+        bad_path = tmp_path / "not_a_journal.db"
+        conn = sqlite3.connect(bad_path)
+        conn.execute("CREATE TABLE other (x)")
+        conn.close()
+
+        with pytest.raises(sqlite3.OperationalError):
+            file_db.import_from_db(str(bad_path))
+
+        file_db.add_entry(title="Still indexed", description="After failed import")
+        assert len(file_db.search("indexed")) == 1
+
+    def test_import_dedup_uses_index(self, populated_db, tmp_path):
+        """Test that the duplicate check seeks idx_dedup instead of scanning."""
+        export_path = populated_db.export_to_db(str(tmp_path / "test_export.db"))
+
+        conn = populated_db.conn
+        conn.execute("ATTACH DATABASE ? AS source", (export_path,))
+        try:
+            cursor = conn.execute("EXPLAIN QUERY PLAN " + JournalDatabase._SQL_IMPORT)
+            plan = " ".join(row[3] for row in cursor.fetchall())
+        finally:
+            conn.execute("DETACH DATABASE source")
+
+        assert "idx_dedup" in plan
 
     def test_import_nonexistent_file(self, temp_db):
         """Test importing from non-existent file."""
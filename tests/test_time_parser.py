@@ -2,18 +2,63 @@
 
 import pytest
 from datetime import datetime, timedelta
-from claude_journal.time_parser import parse_time_expression
+from claude_journal import time_parser
+from claude_journal.time_parser import parse_time_expression, _parse_time_expression
+
+
+# A Wednesday in January, so "last month" also crosses a year boundary
+FIXED_NOW = datetime(2025, 1, 15, 12, 0, 0)
+
+
+class _FrozenDateTime(datetime):
+    """datetime whose now() always returns FIXED_NOW."""
+
+    @classmethod
+    def now(cls, tz=None):
+        return FIXED_NOW
+
+
+@pytest.fixture(autouse=True)
+def frozen_now(monkeypatch):
+    """Pin the parser's clock so expected ranges can't drift mid-test."""
+    monkeypatch.setattr(time_parser, "datetime", _FrozenDateTime)
+
+
+MONTHS = [
+    "january", "february", "march", "april", "may", "june",
+    "july", "august", "september", "october", "november", "december"
+]
+
+# Every expression whose parsed range a test inspects
+ALL_EXPRESSIONS = MONTHS + [
+    "today", "yesterday", "this week", "last week", "this month",
+    "last month", "this year", "last year", "last 3 days", "last 1 day",
+    "last 2 weeks", "last 6 months", "january 2024", "2024-01-15",
+    "2023-12-25", "2024-06-01", "2025-03-30", "some random text xyz", "",
+]
+
+
+@pytest.fixture(scope="module")
+def parsed():
+    """Parse every expression once under the frozen clock.
+
+    Returns:
+        Dict of expression -> (start, end) datetimes
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(time_parser, "datetime", _FrozenDateTime)
+        return {
+            expr: tuple(map(datetime.fromisoformat, parse_time_expression(expr)))
+            for expr in ALL_EXPRESSIONS
+        }
 
 
 class TestBasicExpressions:
     """Test basic time expressions."""
 
-    def test_today(self):
+    def test_today(self, parsed):
         """Test 'today' expression."""
-        start, end = parse_time_expression("today")
-
-        start_dt = datetime.fromisoformat(start)
-        end_dt = datetime.fromisoformat(end)
+        start_dt, end_dt = parsed["today"]
 
         assert start_dt.hour == 0
         assert start_dt.minute == 0
@@ -21,18 +66,15 @@ class TestBasicExpressions:
         assert end_dt.minute == 59
 
         # Both should be today
-        today = datetime.now().date()
+        today = FIXED_NOW.date()
         assert start_dt.date() == today
         assert end_dt.date() == today
 
-    def test_yesterday(self):
+    def test_yesterday(self, parsed):
         """Test 'yesterday' expression."""
-        start, end = parse_time_expression("yesterday")
-
-        start_dt = datetime.fromisoformat(start)
-        end_dt = datetime.fromisoformat(end)
+        start_dt, end_dt = parsed["yesterday"]
 
-        yesterday = (datetime.now() - timedelta(days=1)).date()
+        yesterday = (FIXED_NOW - timedelta(days=1)).date()
         assert start_dt.date() == yesterday
         assert end_dt.date() == yesterday
 
@@ -51,15 +93,12 @@ class TestBasicExpressions:
 class TestWeekExpressions:
     """Test week-based expressions."""
 
-    def test_this_week(self):
+    def test_this_week(self, parsed):
         """Test 'this week' expression."""
-        start, end = parse_time_expression("this week")
-
-        start_dt = datetime.fromisoformat(start)
-        end_dt = datetime.fromisoformat(end)
+        start_dt, end_dt = parsed["this week"]
 
         # Start should be Monday of this week
-        now = datetime.now()
+        now = FIXED_NOW
         expected_monday = (now - timedelta(days=now.weekday())).date()
         assert start_dt.date() == expected_monday
 
@@ -72,19 +111,16 @@ class TestWeekExpressions:
         result2 = parse_time_expression("current week")
         assert result1 == result2
 
-    def test_last_week(self):
+    def test_last_week(self, parsed):
         """Test 'last week' expression."""
-        start, end = parse_time_expression("last week")
-
-        start_dt = datetime.fromisoformat(start)
-        end_dt = datetime.fromisoformat(end)
+        start_dt, end_dt = parsed["last week"]
 
         # Should be a 7-day range
         duration = end_dt - start_dt
         assert duration.days == 6  # 6 days difference (inclusive)
 
         # End should be before this week
-        now = datetime.now()
+        now = FIXED_NOW
         this_monday = now - timedelta(days=now.weekday())
         assert end_dt.date() < this_monday.date()
 
@@ -92,14 +128,11 @@ class TestWeekExpressions:
 class TestMonthExpressions:
     """Test month-based expressions."""
 
-    def test_this_month(self):
+    def test_this_month(self, parsed):
         """Test 'this month' expression."""
-        start, end = parse_time_expression("this month")
-
-        start_dt = datetime.fromisoformat(start)
-        end_dt = datetime.fromisoformat(end)
+        start_dt, end_dt = parsed["this month"]
 
-        now = datetime.now()
+        now = FIXED_NOW
 
         # Start should be first of this month
         assert start_dt.day == 1
@@ -115,17 +148,14 @@ class TestMonthExpressions:
         result2 = parse_time_expression("current month")
         assert result1 == result2
 
-    def test_last_month(self):
+    def test_last_month(self, parsed):
         """Test 'last month' expression."""
-        start, end = parse_time_expression("last month")
-
-        start_dt = datetime.fromisoformat(start)
-        end_dt = datetime.fromisoformat(end)
+        start_dt, end_dt = parsed["last month"]
 
         # Should be first and last day of previous month
         assert start_dt.day == 1
 
-        now = datetime.now()
+        now = FIXED_NOW
         if now.month == 1:
             expected_month = 12
             expected_year = now.year - 1
@@ -142,14 +172,11 @@ class TestMonthExpressions:
 class TestYearExpressions:
     """Test year-based expressions."""
 
-    def test_this_year(self):
+    def test_this_year(self, parsed):
         """Test 'this year' expression."""
-        start, end = parse_time_expression("this year")
-
-        start_dt = datetime.fromisoformat(start)
-        end_dt = datetime.fromisoformat(end)
+        start_dt, end_dt = parsed["this year"]
 
-        now = datetime.now()
+        now = FIXED_NOW
 
         # Start should be January 1st
         assert start_dt.month == 1
@@ -165,14 +192,11 @@ class TestYearExpressions:
         result2 = parse_time_expression("current year")
         assert result1 == result2
 
-    def test_last_year(self):
+    def test_last_year(self, parsed):
         """Test 'last year' expression."""
-        start, end = parse_time_expression("last year")
-
-        start_dt = datetime.fromisoformat(start)
-        end_dt = datetime.fromisoformat(end)
+        start_dt, end_dt = parsed["last year"]
 
-        now = datetime.now()
+        now = FIXED_NOW
         last_year = now.year - 1
 
         # Should be January 1 to December 31 of last year
@@ -188,47 +212,35 @@ class TestYearExpressions:
 class TestRelativeExpressions:
     """Test relative 'last N' expressions."""
 
-    def test_last_3_days(self):
+    def test_last_3_days(self, parsed):
         """Test 'last 3 days' expression."""
-        start, end = parse_time_expression("last 3 days")
-
-        start_dt = datetime.fromisoformat(start)
-        end_dt = datetime.fromisoformat(end)
+        start_dt, end_dt = parsed["last 3 days"]
 
         # Should span approximately 3 days
-        now = datetime.now()
+        now = FIXED_NOW
         expected_start = (now - timedelta(days=3)).date()
         assert start_dt.date() == expected_start
         assert end_dt.date() == now.date()
 
-    def test_last_day_singular(self):
+    def test_last_day_singular(self, parsed):
         """Test 'last 1 day' (singular form)."""
-        start, end = parse_time_expression("last 1 day")
-
-        start_dt = datetime.fromisoformat(start)
-        end_dt = datetime.fromisoformat(end)
+        start_dt, end_dt = parsed["last 1 day"]
 
-        now = datetime.now()
+        now = FIXED_NOW
         expected_start = (now - timedelta(days=1)).date()
         assert start_dt.date() == expected_start
 
-    def test_last_2_weeks(self):
+    def test_last_2_weeks(self, parsed):
         """Test 'last 2 weeks' expression."""
-        start, end = parse_time_expression("last 2 weeks")
-
-        start_dt = datetime.fromisoformat(start)
-        end_dt = datetime.fromisoformat(end)
+        start_dt, end_dt = parsed["last 2 weeks"]
 
         # Should span approximately 14 days
         duration = end_dt - start_dt
         assert duration.days >= 13  # At least 13 days
 
-    def test_last_6_months(self):
+    def test_last_6_months(self, parsed):
         """Test 'last 6 months' expression."""
-        start, end = parse_time_expression("last 6 months")
-
-        start_dt = datetime.fromisoformat(start)
-        end_dt = datetime.fromisoformat(end)
+        start_dt, end_dt = parsed["last 6 months"]
 
         # Should span approximately 180 days (6 * 30)
         duration = end_dt - start_dt
@@ -238,15 +250,12 @@ class TestRelativeExpressions:
 class TestMonthNames:
     """Test month name expressions."""
 
-    def test_january(self):
+    def test_january(self, parsed):
         """Test 'january' expression."""
-        start, end = parse_time_expression("january")
-
-        start_dt = datetime.fromisoformat(start)
-        end_dt = datetime.fromisoformat(end)
+        start_dt, end_dt = parsed["january"]
 
         # Should be January 1-31 of current year
-        now = datetime.now()
+        now = FIXED_NOW
         assert start_dt.month == 1
         assert start_dt.day == 1
         assert start_dt.year == now.year
@@ -255,12 +264,9 @@ class TestMonthNames:
         assert end_dt.day == 31
         assert end_dt.year == now.year
 
-    def test_february(self):
+    def test_february(self, parsed):
         """Test 'february' expression."""
-        start, end = parse_time_expression("february")
-
-        start_dt = datetime.fromisoformat(start)
-        end_dt = datetime.fromisoformat(end)
+        start_dt, end_dt = parsed["february"]
 
         assert start_dt.month == 2
         assert start_dt.day == 1
@@ -269,12 +275,9 @@ class TestMonthNames:
         # February can be 28 or 29 days
         assert end_dt.day in [28, 29]
 
-    def test_december(self):
+    def test_december(self, parsed):
         """Test 'december' expression."""
-        start, end = parse_time_expression("december")
-
-        start_dt = datetime.fromisoformat(start)
-        end_dt = datetime.fromisoformat(end)
+        start_dt, end_dt = parsed["december"]
 
         assert start_dt.month == 12
         assert start_dt.day == 1
@@ -282,12 +285,9 @@ class TestMonthNames:
         assert end_dt.month == 12
         assert end_dt.day == 31
 
-    def test_month_with_year(self):
+    def test_month_with_year(self, parsed):
         """Test 'january 2024' expression."""
-        start, end = parse_time_expression("january 2024")
-
-        start_dt = datetime.fromisoformat(start)
-        end_dt = datetime.fromisoformat(end)
+        start_dt, end_dt = parsed["january 2024"]
 
         assert start_dt.year == 2024
         assert start_dt.month == 1
@@ -297,28 +297,21 @@ class TestMonthNames:
         assert end_dt.month == 1
         assert end_dt.day == 31
 
-    def test_all_months(self):
+    @pytest.mark.parametrize("month, number", [
+        (month, number) for number, month in enumerate(MONTHS, 1)
+    ])
+    def test_all_months(self, parsed, month, number):
         """Test all month names are recognized."""
-        months = [
-            "january", "february", "march", "april", "may", "june",
-            "july", "august", "september", "october", "november", "december"
-        ]
-
-        for i, month in enumerate(months, 1):
-            start, end = parse_time_expression(month)
-            start_dt = datetime.fromisoformat(start)
-            assert start_dt.month == i
+        start_dt, _ = parsed[month]
+        assert start_dt.month == number
 
 
 class TestISODate:
     """Test ISO date format."""
 
-    def test_iso_date_format(self):
+    def test_iso_date_format(self, parsed):
         """Test '2024-01-15' format."""
-        start, end = parse_time_expression("2024-01-15")
-
-        start_dt = datetime.fromisoformat(start)
-        end_dt = datetime.fromisoformat(end)
+        start_dt, end_dt = parsed["2024-01-15"]
 
         assert start_dt.year == 2024
         assert start_dt.month == 1
@@ -330,46 +323,37 @@ class TestISODate:
         assert start_dt.hour == 0
         assert end_dt.hour == 23
 
-    def test_iso_date_different_dates(self):
+    @pytest.mark.parametrize("date_str, year, month, day", [
+        ("2023-12-25", 2023, 12, 25),
+        ("2024-06-01", 2024, 6, 1),
+        ("2025-03-30", 2025, 3, 30),
+    ])
+    def test_iso_date_different_dates(self, parsed, date_str, year, month, day):
         """Test various ISO dates."""
-        dates = [
-            ("2023-12-25", 2023, 12, 25),
-            ("2024-06-01", 2024, 6, 1),
-            ("2025-03-30", 2025, 3, 30),
-        ]
-
-        for date_str, year, month, day in dates:
-            start, end = parse_time_expression(date_str)
-            start_dt = datetime.fromisoformat(start)
+        start_dt, _ = parsed[date_str]
 
-            assert start_dt.year == year
-            assert start_dt.month == month
-            assert start_dt.day == day
+        assert start_dt.year == year
+        assert start_dt.month == month
+        assert start_dt.day == day
 
 
 class TestFallback:
     """Test fallback behavior for unrecognized expressions."""
 
-    def test_unknown_expression(self):
+    def test_unknown_expression(self, parsed):
         """Test that unknown expressions default to last 7 days."""
-        start, end = parse_time_expression("some random text xyz")
-
-        start_dt = datetime.fromisoformat(start)
-        end_dt = datetime.fromisoformat(end)
+        start_dt, end_dt = parsed["some random text xyz"]
 
         # Should default to last 7 days
-        now = datetime.now()
+        now = FIXED_NOW
         expected_start = (now - timedelta(days=7)).date()
 
         assert start_dt.date() == expected_start
         assert end_dt.date() == now.date()
 
-    def test_empty_string(self):
+    def test_empty_string(self, parsed):
         """Test empty string defaults to last 7 days."""
-        start, end = parse_time_expression("")
-
-        start_dt = datetime.fromisoformat(start)
-        end_dt = datetime.fromisoformat(end)
+        start_dt, end_dt = parsed[""]
 
         # Should span approximately 7 days
         duration = end_dt - start_dt
@@ -379,40 +363,49 @@ class TestFallback:
 class TestTimeRanges:
     """Test that time ranges are correctly set."""
 
-    def test_start_is_beginning_of_day(self):
+    @pytest.mark.parametrize("expr", ["today", "yesterday", "last week", "january"])
+    def test_start_is_beginning_of_day(self, parsed, expr):
         """Test that start times are set to beginning of day."""
-        expressions = ["today", "yesterday", "last week", "january"]
+        start_dt, _ = parsed[expr]
 
-        for expr in expressions:
-            start, end = parse_time_expression(expr)
-            start_dt = datetime.fromisoformat(start)
-
-            assert start_dt.hour == 0
-            assert start_dt.minute == 0
-            assert start_dt.second == 0
+        assert start_dt.hour == 0
+        assert start_dt.minute == 0
+        assert start_dt.second == 0
 
-    def test_end_is_end_of_day(self):
+    @pytest.mark.parametrize("expr", ["today", "yesterday", "last week", "january"])
+    def test_end_is_end_of_day(self, parsed, expr):
         """Test that end times are set to end of day."""
-        expressions = ["today", "yesterday", "last week", "january"]
+        _, end_dt = parsed[expr]
 
-        for expr in expressions:
-            start, end = parse_time_expression(expr)
-            end_dt = datetime.fromisoformat(end)
-
-            assert end_dt.hour == 23
-            assert end_dt.minute == 59
-            assert end_dt.second == 59
+        assert end_dt.hour == 23
+        assert end_dt.minute == 59
+        assert end_dt.second == 59
 
-    def test_start_before_end(self):
+    @pytest.mark.parametrize("expr", [
+        "today", "yesterday", "last week", "last month",
+        "last year", "january", "last 3 days", "2024-01-15"
+    ])
+    def test_start_before_end(self, parsed, expr):
         """Test that start is always before end."""
-        expressions = [
-            "today", "yesterday", "last week", "last month",
-            "last year", "january", "last 3 days", "2024-01-15"
-        ]
+        start_dt, end_dt = parsed[expr]
+
+        assert start_dt <= end_dt
+
+
+class TestCaching:
+    """Test reuse of parsed expressions."""
+
+    def test_repeated_expression_uses_cache(self):
+        """Test that repeating an expression reuses the cached range."""
+        parse_time_expression("last 5 days")
+        hits = _parse_time_expression.cache_info().hits
+
+        assert parse_time_expression("LAST 5 DAYS") == parse_time_expression("last 5 days")
+        assert _parse_time_expression.cache_info().hits >= hits + 2
 
-        for expr in expressions:
-            start, end = parse_time_expression(expr)
-            start_dt = datetime.fromisoformat(start)
-            end_dt = datetime.fromisoformat(end)
+    def test_cache_keyed_on_current_time(self):
+        """Test that a different 'now' is not served from the cache."""
+        later = datetime(2024, 3, 2, 9, 30)
+        earlier = datetime(2024, 3, 1, 9, 30)
 
-            assert start_dt <= end_dt, f"Failed for expression: {expr}"
+        assert _parse_time_expression("today", later) != _parse_time_expression("today", earlier)